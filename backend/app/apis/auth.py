@@ -2,16 +2,18 @@
 # ------------------------------
 # This file contains the API endpoints for authentication (regist
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from ..models.user_model import UserCreate, UserPublic
-from ..models.token_model import Token
+from ..models.user_model import UserCreate, UserPublic, CurrentUser, CapabilitiesUpdate
+from ..models.token_model import Token, RefreshRequest, LogoutRequest
 from ..db.database import user_collection
-from ..core.security import get_password_hash, verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from ..core.security import get_password_hash, verify_password, create_token_pair, decode_token, get_current_user, optional_oauth2_scheme
+from ..core.revocation import revocation_list
+from ..core.timing import TimedRoute
 from bson import ObjectId
-from datetime import timedelta
+from datetime import datetime, timezone
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.post("/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
@@ -53,7 +55,7 @@ async def register_user(user: UserCreate):
 @router.post("/login", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """
-    Handles user login and returns a JWT token.
+    Handles user login and returns a JWT access token and a refresh token.
     - Uses OAuth2PasswordRequestForm for standard form data (username, password).
     """
     user = user_collection.find_one({"email": form_data.username})  # Note: username is the email
@@ -64,9 +66,108 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user["email"], "role": user["role"]}, expires_delta=access_token_expires
+    return create_token_pair(user)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(refresh_request: RefreshRequest):
+    """
+    Exchanges a refresh token for a new token pair without checking the password.
+    The user is re-read so the new access token carries their current role.
+    The refresh token is rotated: the one that was used is revoked.
+    Revocations are checked in the database rather than in this worker's
+    synced copy, so a token revoked or already used elsewhere is rejected.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = decode_token(refresh_request.refresh_token, token_type="refresh")
+    if revocation_list.is_user_revoked(payload):
+        raise credentials_exception
+
+    user = user_collection.find_one({"_id": ObjectId(payload["sub"])})
+    if user is None:
+        raise credentials_exception
+
+    # Revoking the used token succeeds only once, even for concurrent requests
+    if not revocation_list.revoke_token(payload["jti"], datetime.fromtimestamp(payload["exp"], timezone.utc)):
+        raise credentials_exception
+    return create_token_pair(user)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    logout_request: LogoutRequest | None = None,
+    token: str | None = Depends(optional_oauth2_scheme),
+):
+    """
+    Revokes the access token and, if given, the refresh token.
+    Either token identifies the user, and the access token may have expired,
+    so logging out after the session went idle still revokes the refresh token.
+    With `all_sessions`, every token issued to the user so far is revoked.
+    """
+    logout_request = logout_request or LogoutRequest()
+    payloads = []
+    for candidate, token_type in ((token, "access"), (logout_request.refresh_token, "refresh")):
+        if not candidate:
+            continue
+        try:
+            payloads.append(decode_token(candidate, token_type=token_type, verify_exp=False))
+        except HTTPException:
+            pass # Invalid or already revoked
+
+    # Both tokens, when valid, must belong to the same user
+    if not payloads or len({payload["sub"] for payload in payloads}) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    for payload in payloads:
+        revocation_list.revoke_token(payload["jti"], datetime.fromtimestamp(payload["exp"], timezone.utc))
+
+    if logout_request.all_sessions:
+        revocation_list.revoke_user(payloads[0]["sub"])
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/me", response_model=UserPublic)
+async def read_current_user(current_user: CurrentUser = Depends(get_current_user)):
+    """Returns the profile of the logged-in user."""
+    user = user_collection.find_one({"_id": ObjectId(current_user.id)})
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user["id"] = str(user["_id"])
+    return UserPublic(**user)
+
+
+@router.put("/me/capabilities", response_model=UserPublic)
+async def update_capabilities(
+    capabilities_update: CapabilitiesUpdate,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Replaces the capability keywords of a Supplier.
+    These are matched against RFPs for recommendations and publish notifications.
+    """
+    if current_user.role != "Supplier":
+        raise HTTPException(status_code=403, detail="Only Suppliers have capability profiles.")
+
+    # Normalize and de-duplicate while keeping the supplier's order
+    capabilities = list(dict.fromkeys(
+        capability.strip().lower() for capability in capabilities_update.capabilities if capability.strip()
+    ))
+    user_collection.update_one(
+        {"_id": ObjectId(current_user.id)},
+        {"$set": {"capabilities": capabilities}}
     )
 
-    return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
+    updated_user = user_collection.find_one({"_id": ObjectId(current_user.id)})
+    updated_user["id"] = str(updated_user["_id"])
+
+    return UserPublic(**updated_user)
@@ -0,0 +1,188 @@
+# FILE: backend/app/apis/evaluations.py
+# -------------------------------------
+# This file contains the API endpoints for scoring and ranking RFP responses.
+
+from fastapi import APIRouter, Depends, HTTPException
+from pymongo import UpdateOne
+from ..models.evaluation_model import (
+    EvaluationCriterion, EvaluationCriteriaUpdate, ResponseScoresUpdate,
+    BulkScoresUpload, ScoresResult, ResponseRanking
+)
+from ..models.user_model import CurrentUser
+from ..core.security import get_current_user
+from ..db.database import rfp_collection, response_collection
+from ..services.scoring_service import rank_responses, ranking_cache, bump_revision
+from ..core.config import Settings, get_settings
+from ..core.timing import TimedRoute
+from bson import ObjectId
+from typing import Dict, List
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_owned_rfp(rfp_id: str, current_user: CurrentUser) -> dict:
+    """Fetches an RFP and checks that the current user is the Buyer who created it."""
+    try:
+        rfp_obj_id = ObjectId(rfp_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid RFP ID format")
+
+    rfp = rfp_collection.find_one({"_id": rfp_obj_id})
+    if rfp is None:
+        raise HTTPException(status_code=404, detail="RFP not found")
+
+    if str(rfp["buyer_id"]) != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to evaluate responses for this RFP")
+
+    return rfp
+
+
+def validate_scores(rfp: dict, scores: Dict[str, float]) -> dict:
+    """
+    Checks scores against the RFP's criteria and returns them as a MongoDB
+    $set document, so only the submitted criteria are overwritten.
+    """
+    criteria = {criterion["name"]: criterion for criterion in rfp.get("evaluation_criteria", [])}
+    if not criteria:
+        raise HTTPException(status_code=400, detail="Define evaluation criteria for this RFP first.")
+
+    update = {}
+    for name, value in scores.items():
+        criterion = criteria.get(name)
+        if criterion is None:
+            raise HTTPException(status_code=400, detail=f"Unknown evaluation criterion: {name}")
+        if not 0 <= value <= criterion["max_score"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Score for '{name}' must be between 0 and {criterion['max_score']}"
+            )
+        update[f"scores.{name}"] = value
+    return update
+
+
+@router.get("/{rfp_id}/criteria", response_model=List[EvaluationCriterion])
+async def get_evaluation_criteria(rfp_id: str, current_user: CurrentUser = Depends(get_current_user)):
+    rfp = get_owned_rfp(rfp_id, current_user)
+    return rfp.get("evaluation_criteria", [])
+
+
+@router.put("/{rfp_id}/criteria", response_model=List[EvaluationCriterion])
+async def set_evaluation_criteria(
+    rfp_id: str,
+    criteria_update: EvaluationCriteriaUpdate,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Replaces the weighted evaluation criteria of an RFP.
+    Scores for criteria that are removed are kept but no longer ranked.
+    """
+    rfp = get_owned_rfp(rfp_id, current_user)
+
+    names = [criterion.name for criterion in criteria_update.criteria]
+    if len(set(names)) != len(names):
+        raise HTTPException(status_code=400, detail="Criterion names must be unique.")
+
+    criteria = [criterion.dict() for criterion in criteria_update.criteria]
+    rfp_collection.update_one(
+        {"_id": rfp["_id"]},
+        {"$set": {"evaluation_criteria": criteria}, "$inc": {"ranking_revision": 1}}
+    )
+    return criteria
+
+
+@router.put("/{rfp_id}/responses/{response_id}/scores", response_model=ScoresResult)
+async def score_response(
+    rfp_id: str,
+    response_id: str,
+    scores_update: ResponseScoresUpdate,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Sets the scores of a single response for one or more criteria.
+    """
+    rfp = get_owned_rfp(rfp_id, current_user)
+
+    try:
+        response_obj_id = ObjectId(response_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid response ID format")
+
+    update = validate_scores(rfp, scores_update.scores)
+    if not update:
+        return ScoresResult(updated=0)
+
+    result = response_collection.update_one(
+        {"_id": response_obj_id, "rfp_id": rfp["_id"]},
+        {"$set": update}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Response not found")
+
+    bump_revision(rfp["_id"])
+    return ScoresResult(updated=result.matched_count)
+
+
+@router.post("/{rfp_id}/scores/bulk", response_model=ScoresResult)
+async def upload_scores(
+    rfp_id: str,
+    upload: BulkScoresUpload,
+    current_user: CurrentUser = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Sets the scores of many responses in one request, e.g. after a review
+    committee meeting. All items are validated before anything is written.
+    """
+    rfp = get_owned_rfp(rfp_id, current_user)
+
+    max_items = settings.max_bulk_scores
+    if len(upload.items) > max_items:
+        raise HTTPException(status_code=400, detail=f"At most {max_items} items can be uploaded at once.")
+
+    operations = []
+    response_ids = set()
+    for item in upload.items:
+        try:
+            response_obj_id = ObjectId(item.response_id)
+        except Exception:
+            raise HTTPException(status_code=400, detail=f"Invalid response ID format: {item.response_id}")
+        update = validate_scores(rfp, item.scores)
+        if update:
+            response_ids.add(response_obj_id)
+            operations.append(UpdateOne({"_id": response_obj_id, "rfp_id": rfp["_id"]}, {"$set": update}))
+
+    if not operations:
+        return ScoresResult(updated=0)
+
+    found = response_collection.count_documents({"_id": {"$in": list(response_ids)}, "rfp_id": rfp["_id"]})
+    if found != len(response_ids):
+        raise HTTPException(status_code=404, detail="One or more responses were not found for this RFP")
+
+    result = response_collection.bulk_write(operations, ordered=False)
+    bump_revision(rfp["_id"])
+    return ScoresResult(updated=result.matched_count)
+
+
+@router.get("/{rfp_id}/ranking", response_model=ResponseRanking)
+async def get_response_ranking(rfp_id: str, current_user: CurrentUser = Depends(get_current_user)):
+    """
+    Ranks all responses to an RFP by their normalized weighted total.
+    The ranking is cached until a criterion, score or response changes.
+    """
+    rfp = get_owned_rfp(rfp_id, current_user)
+
+    criteria = rfp.get("evaluation_criteria", [])
+    if not criteria:
+        raise HTTPException(status_code=400, detail="Define evaluation criteria for this RFP first.")
+
+    revision = rfp.get("ranking_revision", 0)
+    ranking = ranking_cache.get(rfp_id, revision)
+    if ranking is None:
+        responses = response_collection.find(
+            {"rfp_id": rfp["_id"]},
+            {"supplier_id": 1, "status": 1, "scores": 1}
+        )
+        ranking = rank_responses(criteria, list(responses))
+        ranking_cache.set(rfp_id, revision, ranking)
+
+    return ResponseRanking(rfp_id=rfp_id, criteria=criteria, responses=ranking)
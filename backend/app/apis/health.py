@@ -0,0 +1,55 @@
+# FILE: backend/app/apis/health.py
+# --------------------------------
+# This file contains the liveness and readiness endpoints used by the
+# process manager and load balancer, and the payload statistics of the worker.
+
+from fastapi import APIRouter, Depends, Response, status
+from ..db.database import get_client, pool_stats
+from ..core.config import Settings, get_settings
+from ..core.compression import payload_stats
+from ..core.timing import TimedRoute
+import os
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("/live")
+def liveness():
+    """The process is up and serving requests."""
+    return {"status": "ok", "pid": os.getpid()}
+
+
+@router.get("/ready")
+def readiness(response: Response, settings: Settings = Depends(get_settings)):
+    """
+    The worker can serve traffic: MongoDB answers a ping and the connection
+    pool is not saturated. The ping is bounded by the server selection timeout.
+    """
+    pool = pool_stats.snapshot()
+    try:
+        get_client().admin.command("ping")
+        database = "ok"
+    except Exception as e:
+        database = f"unavailable: {e.__class__.__name__}"
+
+    ready = database == "ok" and pool["saturation"] < settings.pool_saturation_threshold
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {
+        "status": "ready" if ready else "not ready",
+        "pid": os.getpid(),
+        "database": database,
+        "pool": pool,
+    }
+
+
+@router.get("/payload")
+def payload():
+    """
+    Response sizes and timings of this worker since it started, per encoding
+    and per endpoint: `handler_ms` is the wall time of the route,
+    `serialization_ms` the part spent validating and serializing the result
+    (see TimedRoute), and `compression_cpu_ms` the CPU time of compression.
+    """
+    return {"pid": os.getpid(), **payload_stats.snapshot()}
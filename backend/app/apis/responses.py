@@ -4,7 +4,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from ..models.response_model import ResponsePublic, ResponseStatusUpdate
-from ..models.user_model import UserInDB
+from ..models.user_model import CurrentUser
 from ..core.security import get_current_user
 from ..services.email_service import send_email_simulation
 from ..db.database import rfp_collection, response_collection, user_collection
@@ -14,14 +14,18 @@ import shutil
 from pathlib import Path
 from typing import List
 from ..services.cloudinary_service import upload_file
+from ..services.matching_service import matching_index
+from ..services.summary_service import ListView, summarize
+from ..core.uploads import ensure_upload_size
+from ..core.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 # Define the base directory of the backend project to resolve file paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 @router.get("/submissions/my", response_model=List[ResponsePublic])
-async def get_my_submissions(current_user: UserInDB = Depends(get_current_user)):
+async def get_my_submissions(view: ListView = "full", current_user: CurrentUser = Depends(get_current_user)):
     if current_user.role != "Supplier":
         raise HTTPException(status_code=403, detail="Only Suppliers can view their submissions.")
 
@@ -52,16 +56,20 @@ async def get_my_submissions(current_user: UserInDB = Depends(get_current_user))
     ]
     
     responses_cursor = response_collection.aggregate(pipeline)
+    if view == "summary":
+        return [summarize(response, "response_text") for response in responses_cursor]
     return list(responses_cursor)
 
 @router.get("/{rfp_id}/responses", response_model=List[ResponsePublic])
 async def list_responses_for_rfp(
     rfp_id: str,
-    current_user: UserInDB = Depends(get_current_user)
+    view: ListView = "full",
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """
     Lists all responses for a specific RFP.
     Only accessible by the Buyer who created the RFP.
+    With view=summary, response texts are cut to a snippet.
     """
     try:
         rfp_obj_id = ObjectId(rfp_id)
@@ -82,6 +90,8 @@ async def list_responses_for_rfp(
         response["id"] = str(response["_id"])
         response["rfp_id"] = str(response["rfp_id"])
         response["supplier_id"] = str(response["supplier_id"])
+        if view == "summary":
+            summarize(response, "response_text")
         response_list.append(ResponsePublic(**response))
         
     return response_list
@@ -91,7 +101,7 @@ async def submit_response(
     rfp_id: str,
     response_text: str = Form(...),
     file: UploadFile = File(...),
-    current_user: UserInDB = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """
     Submits a response to a specific RFP. Only accessible by Suppliers.
@@ -109,6 +119,8 @@ async def submit_response(
     if rfp is None or rfp.get("status") not in ["Published", "Response Submitted"]:
         raise HTTPException(status_code=404, detail="RFP is not open for responses.")
 
+    ensure_upload_size(file)
+
     # Save the uploaded file to cloudinary
     file_url = upload_file(file.file, folder="rfp_responses", original_filename=file.filename)
     if not file_url:
@@ -125,10 +137,13 @@ async def submit_response(
     }
     result = response_collection.insert_one(response_data)
 
-    # Update the RFP status to 'Response Submitted'
+    # Update the RFP status to 'Response Submitted' and invalidate its cached ranking
     rfp_collection.update_one(
         {"_id": rfp_obj_id},
-        {"$set": {"status": "Response Submitted", "updated_at": datetime.now(timezone.utc)}}
+        {
+            "$set": {"status": "Response Submitted", "updated_at": datetime.now(timezone.utc)},
+            "$inc": {"ranking_revision": 1}
+        }
     )
 
 # --- EMAIL NOTIFICATION LOGIC ---
@@ -155,7 +170,7 @@ async def update_response_status(
     rfp_id: str,
     response_id: str,
     status_update: ResponseStatusUpdate,
-    current_user: UserInDB = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """
     Approves or rejects a specific response.
@@ -182,8 +197,13 @@ async def update_response_status(
         # If one response is approved, update the main RFP's status to 'Approved'
         rfp_collection.update_one(
             {"_id": rfp_obj_id},
-            {"$set": {"status": "Approved", "updated_at": datetime.now(timezone.utc)}}
+            {
+                "$set": {"status": "Approved", "updated_at": datetime.now(timezone.utc)},
+                "$inc": {"ranking_revision": 1}
+            }
         )
+        # An approved RFP is closed and no longer recommended to suppliers
+        matching_index.remove_rfp(rfp_obj_id)
         
         # AND auto-reject all other 'Submitted' responses for this RFP
         response_collection.update_many(
@@ -198,7 +218,7 @@ async def update_response_status(
         # If a response is rejected, we just update the main RFP's timestamp
         rfp_collection.update_one(
             {"_id": rfp_obj_id},
-            {"$set": {"updated_at": datetime.now(timezone.utc)}}
+            {"$set": {"updated_at": datetime.now(timezone.utc)}, "$inc": {"ranking_revision": 1}}
         )
 
     updated_response = response_collection.find_one({"_id": response_obj_id})
@@ -2,12 +2,13 @@
 # ------------------------------
 # This file contains the API endpoints for managing RFPs.
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Response
-from ..models.rfp_model import RFPPublic, RFPStatusUpdate
-from ..models.user_model import UserInDB
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Response, Query
+from ..models.rfp_model import RFPPublic, RFPRecommendation, RFPStatusUpdate
+from ..models.version_model import RFPVersionSummary, RFPVersionPublic, RFPVersionDiff
+from ..models.user_model import CurrentUser
 from ..core.security import get_current_user
 from ..services.email_service import send_email_simulation
-from ..db.database import rfp_collection, response_collection, user_collection
+from ..db.database import rfp_collection, rfp_version_collection, response_collection, user_collection
 from bson import ObjectId
 from datetime import datetime, timezone
 from typing import List
@@ -15,8 +16,14 @@ import shutil
 from pathlib import Path
 import re
 from ..services.cloudinary_service import upload_file
+from ..services import version_service
+from ..services.summary_service import ListView, summarize
+from ..services.matching_service import matching_index, OPEN_STATUSES
+from ..core.config import Settings, get_settings
+from ..core.uploads import ensure_upload_size
+from ..core.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -25,10 +32,47 @@ def sanitize_filename(filename: str) -> str:
     """Removes special characters and replaces spaces with underscores."""
     return re.sub(r'[^a-zA-Z0-9._-]', '_', filename)
 
+
+def get_viewable_rfp(rfp_id: str, current_user: CurrentUser) -> dict:
+    """
+    Fetches an RFP and checks that the current user may view it.
+    - Buyers can only view their own RFPs.
+    - Suppliers can view open RFPs or ones they have already responded to.
+    """
+    try:
+        obj_id = ObjectId(rfp_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid RFP ID format")
+
+    rfp = rfp_collection.find_one({"_id": obj_id})
+    if rfp is None:
+        raise HTTPException(status_code=404, detail="RFP not found")
+
+    # Authorization check
+    if current_user.role == 'Buyer':
+        if str(rfp["buyer_id"]) != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this RFP")
+    elif current_user.role == 'Supplier':
+        has_submitted = response_collection.find_one({"rfp_id": obj_id, "supplier_id": ObjectId(current_user.id)})
+        # A supplier can view if it's open for bidding OR if they have already submitted.
+        if rfp["status"] not in ["Published", "Response Submitted"] and not has_submitted:
+             raise HTTPException(status_code=403, detail="This RFP is not available for viewing")
+
+    return rfp
+
+
+def to_version_model(version: dict) -> dict:
+    """Converts the ObjectIds of a stored version to strings for the response models."""
+    version["rfp_id"] = str(version["rfp_id"])
+    if version.get("created_by") is not None:
+        version["created_by"] = str(version["created_by"])
+    return version
+
 @router.get("/search", response_model=List[RFPPublic])
-async def search_rfps(q: str):
+async def search_rfps(q: str, view: ListView = "full"):
     """
     Performs a full-text search on the 'title' and 'description' of published RFPs.
+    With view=summary, descriptions are cut to a snippet.
     """
     query = {
         "$text": {"$search": q},
@@ -43,17 +87,20 @@ async def search_rfps(q: str):
     for rfp in rfps_cursor:
         rfp["id"] = str(rfp["_id"])
         rfp["buyer_id"] = str(rfp["buyer_id"])
+        if view == "summary":
+            summarize(rfp, "description")
         rfp_list.append(RFPPublic(**rfp))
 
     return rfp_list
 
 
 @router.get("/", response_model=List[RFPPublic])
-async def list_rfps(current_user: UserInDB = Depends(get_current_user)):
+async def list_rfps(view: ListView = "full", current_user: CurrentUser = Depends(get_current_user)):
     """
     Lists RFPs based on user role.
     - Suppliers see RFPs that are 'Published' or have responses.
     - Buyers see all RFPs they have created.
+    With view=summary, descriptions are cut to a snippet.
     """
     if current_user.role == "Supplier":
         # A supplier should see all RFPs that are open for submission.
@@ -70,33 +117,55 @@ async def list_rfps(current_user: UserInDB = Depends(get_current_user)):
     for rfp in rfps_cursor:
         rfp["id"] = str(rfp["_id"])
         rfp["buyer_id"] = str(rfp["buyer_id"])
+        if view == "summary":
+            summarize(rfp, "description")
         rfp_list.append(RFPPublic(**rfp))
         
     return rfp_list
 
-@router.get("/{rfp_id}", response_model=RFPPublic)
-async def get_rfp_by_id(rfp_id: str, current_user: UserInDB = Depends(get_current_user)):
+@router.get("/recommended", response_model=List[RFPRecommendation])
+async def recommend_rfps(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: CurrentUser = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+):
     """
-    Retrieves a single RFP by its ID with corrected authorization checks.
+    Returns the open RFPs that best match the current Supplier's capabilities,
+    ranked by TF-IDF cosine similarity.
     """
-    try:
-        obj_id = ObjectId(rfp_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid RFP ID format")
+    if not settings.recommendations_enabled:
+        raise HTTPException(status_code=404, detail="RFP recommendations are disabled.")
 
-    rfp = rfp_collection.find_one({"_id": obj_id})
-    if rfp is None:
-        raise HTTPException(status_code=404, detail="RFP not found")
+    if current_user.role != "Supplier":
+        raise HTTPException(status_code=403, detail="Only Suppliers can get RFP recommendations.")
 
-    # Authorization check
-    if current_user.role == 'Buyer':
-        if str(rfp["buyer_id"]) != current_user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to view this RFP")
-    elif current_user.role == 'Supplier':
-        has_submitted = response_collection.find_one({"rfp_id": obj_id, "supplier_id": ObjectId(current_user.id)})
-        # A supplier can view if it's open for bidding OR if they have already submitted.
-        if rfp["status"] not in ["Published", "Response Submitted"] and not has_submitted:
-             raise HTTPException(status_code=403, detail="This RFP is not available for viewing")
+    # Capabilities are not carried in the token, so read the supplier's profile
+    supplier = user_collection.find_one({"_id": ObjectId(current_user.id)}, {"capabilities": 1})
+    matches = matching_index.recommend((supplier or {}).get("capabilities", []), limit=limit)
+    if not matches:
+        return []
+
+    scores = dict(matches)
+    rfps_cursor = rfp_collection.find({
+        "_id": {"$in": [ObjectId(rfp_id) for rfp_id in scores]},
+        "status": {"$in": OPEN_STATUSES}
+    })
+
+    rfp_list = []
+    for rfp in rfps_cursor:
+        rfp["id"] = str(rfp["_id"])
+        rfp["buyer_id"] = str(rfp["buyer_id"])
+        rfp_list.append(RFPRecommendation(**rfp, match_score=scores[rfp["id"]]))
+
+    rfp_list.sort(key=lambda rfp: rfp.match_score, reverse=True)
+    return rfp_list
+
+@router.get("/{rfp_id}", response_model=RFPPublic)
+async def get_rfp_by_id(rfp_id: str, current_user: CurrentUser = Depends(get_current_user)):
+    """
+    Retrieves a single RFP by its ID with corrected authorization checks.
+    """
+    rfp = get_viewable_rfp(rfp_id, current_user)
 
     rfp["id"] = str(rfp["_id"])
     rfp["buyer_id"] = str(rfp["buyer_id"])
@@ -108,7 +177,7 @@ async def create_rfp(
         title: str = Form(...),
         description: str = Form(...),
         file: UploadFile = File(...),
-        current_user: UserInDB = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
 ):
     if current_user.role != "Buyer":
         raise HTTPException(
@@ -116,6 +185,11 @@ async def create_rfp(
             detail="Only Buyers can create RFPs."
         )
 
+    ensure_upload_size(file)
+
+    # Hash the document so later versions can tell whether it changed
+    document_hash = version_service.hash_file(file.file)
+
     # Upload the file to Cloudinary instead of saving locally
     file_url = upload_file(file.file, folder="rfp_documents", original_filename=file.filename)
     if not file_url:
@@ -136,6 +210,11 @@ async def create_rfp(
     # Fetch the created RFP to return its public data
     created_rfp = rfp_collection.find_one({"_id": result.inserted_id})
 
+    # The initial state is version 1 of the RFP's history
+    version_service.record_version(
+        created_rfp, document_hash=document_hash, created_by=ObjectId(current_user.id)
+    )
+
     # Convert ObjectId to string for the response model
     created_rfp["id"] = str(created_rfp["_id"])
     created_rfp["buyer_id"] = str(created_rfp["buyer_id"])
@@ -149,11 +228,11 @@ async def update_rfp(
         title: str = Form(...),
         description: str = Form(...),
         file: UploadFile = File(...),
-        current_user: UserInDB = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
 ):
     """
     Updates an existing RFP's details and document.
-    Serves as a basic version control mechanism.
+    Every update is recorded as a new version in the RFP's history.
     """
     try:
         obj_id = ObjectId(rfp_id)
@@ -167,36 +246,134 @@ async def update_rfp(
     if str(rfp["buyer_id"]) != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this RFP")
 
-    # Save the new file version
-    uploads_dir = BASE_DIR / "uploads"
-    file_path = uploads_dir / file.filename
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Update the RFP document in the database
-    update_data = {
-        "$set": {
+    ensure_upload_size(file)
+
+    # RFPs created before version history existed start it with their current state
+    version_service.ensure_baseline(rfp)
+
+    # Documents are stored by content hash, so an unchanged file is not saved
+    # again and a new file never overwrites the one of an older version.
+    document_hash = version_service.hash_file(file.file)
+    document_url = version_service.find_document_by_hash(obj_id, document_hash)
+    if document_url is None:
+        filename = sanitize_filename(file.filename)
+        version_dir = BASE_DIR / "uploads" / document_hash
+        version_dir.mkdir(parents=True, exist_ok=True)
+        with open(version_dir / filename, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+        document_url = f"uploads/{document_hash}/{filename}"
+
+    # Update the RFP and record it as a new version. Two overlapping updates
+    # cannot both apply to the same version, so the second one is rejected.
+    updated_rfp = version_service.update_rfp(
+        rfp,
+        {
             "title": title,
             "description": description,
-            "document_url": f"uploads/{file.filename}",
+            "document_url": document_url,
             "updated_at": datetime.now(timezone.utc)
-        }
-    }
-    rfp_collection.update_one({"_id": obj_id}, update_data)
+        },
+        document_hash=document_hash,
+        created_by=ObjectId(current_user.id)
+    )
+    if updated_rfp is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The RFP was changed by another update. Reload it and try again."
+        )
+
+    # Keep the matching index in sync with the new text
+    if updated_rfp["status"] in OPEN_STATUSES:
+        matching_index.add_rfp(updated_rfp)
 
-    # Fetch and return the updated document
-    updated_rfp = rfp_collection.find_one({"_id": obj_id})
     updated_rfp["id"] = str(updated_rfp["_id"])
     updated_rfp["buyer_id"] = str(updated_rfp["buyer_id"])
 
     return RFPPublic(**updated_rfp)
 
 
+@router.get("/{rfp_id}/versions", response_model=List[RFPVersionSummary])
+async def list_rfp_versions(
+    rfp_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Lists the recorded versions of an RFP, newest first.
+    """
+    rfp = get_viewable_rfp(rfp_id, current_user)
+
+    versions = version_service.list_versions(rfp["_id"], skip=skip, limit=limit)
+    return [RFPVersionSummary(**to_version_model(version)) for version in versions]
+
+
+@router.get("/{rfp_id}/versions/{version}", response_model=RFPVersionPublic)
+async def get_rfp_version(
+    rfp_id: str,
+    version: int,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Retrieves the full content of a single version of an RFP.
+    """
+    rfp = get_viewable_rfp(rfp_id, current_user)
+
+    rfp_version = version_service.get_version(rfp["_id"], version)
+    if rfp_version is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    return RFPVersionPublic(**to_version_model(rfp_version))
+
+
+@router.get("/{rfp_id}/versions/{version}/diff", response_model=RFPVersionDiff)
+async def diff_rfp_versions(
+    rfp_id: str,
+    version: int,
+    against: int | None = Query(None, ge=1, description="Version to compare with. Defaults to the previous version; version 1 is compared with an empty RFP."),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(200, ge=1, le=1000),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Returns a paged, line-based unified diff of the description between two versions.
+    """
+    rfp = get_viewable_rfp(rfp_id, current_user)
+
+    if against is None:
+        against = version - 1
+
+    if against == 0:
+        # The first version has no predecessor, so it is shown as all additions
+        old_version = version_service.empty_version()
+    else:
+        old_version = version_service.get_version(rfp["_id"], against)
+    new_version = version_service.get_version(rfp["_id"], version)
+    if old_version is None or new_version is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    lines = version_service.diff_lines(old_version, new_version)
+
+    return RFPVersionDiff(
+        rfp_id=rfp_id,
+        from_version=against,
+        to_version=version,
+        title_from=old_version["title"],
+        title_to=new_version["title"],
+        document_changed=old_version.get("document_url") != new_version.get("document_url"),
+        total_lines=len(lines),
+        offset=offset,
+        limit=limit,
+        lines=lines[offset:offset + limit]
+    )
+
+
 @router.patch("/{rfp_id}/status", response_model=RFPPublic)
 async def update_rfp_status(
     rfp_id: str,
     status_update: RFPStatusUpdate,
-    current_user: UserInDB = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Updates the status of an RFP (e.g., from 'Draft' to 'Published').
@@ -216,11 +393,30 @@ async def update_rfp_status(
     if str(rfp["buyer_id"]) != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this RFP")
 
+    # Update the status first, so the matching index never holds a change
+    # that a rebuild from the database would not see
+    update_data = {
+        "$set": {
+            "status": status_update.status,
+            "updated_at": datetime.now(timezone.utc)
+        }
+    }
+    rfp_collection.update_one({"_id": obj_id}, update_data)
+
+    # --- MATCHING INDEX ---
+    # Only open RFPs are recommended to suppliers.
+    if status_update.status in OPEN_STATUSES:
+        matching_index.add_rfp(rfp)
+    else:
+        matching_index.remove_rfp(obj_id)
+
     # --- EMAIL NOTIFICATION LOGIC ---
-    # If the status is changing to 'Published', notify all suppliers.
+    # If the status is changing to 'Published', notify the suppliers whose
+    # capabilities match the RFP.
     if status_update.status == "Published":
-        # Find all supplier emails
-        suppliers = user_collection.find({"role": "Supplier"}, {"email": 1})
+        suppliers = user_collection.find({"role": "Supplier"}, {"email": 1, "capabilities": 1})
+        if settings.targeted_notifications_enabled:
+            suppliers = matching_index.match_suppliers(rfp, suppliers)
         supplier_emails = [supplier["email"] for supplier in suppliers]
         
         for email in supplier_emails:
@@ -229,14 +425,6 @@ async def update_rfp_status(
                 subject=f"New RFP Published: {rfp['title']}",
                 body=f"A new RFP titled '{rfp['title']}' has been published. Please log in to view the details."
             )
-    # Update the status
-    update_data = {
-        "$set": {
-            "status": status_update.status,
-            "updated_at": datetime.now(timezone.utc)
-        }
-    }
-    rfp_collection.update_one({"_id": obj_id}, update_data)
 
     # Fetch and return the updated document
     updated_rfp = rfp_collection.find_one({"_id": obj_id})
@@ -246,7 +434,7 @@ async def update_rfp_status(
     return RFPPublic(**updated_rfp)
 
 @router.delete("/{rfp_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_rfp(rfp_id: str, current_user: UserInDB = Depends(get_current_user)):
+async def delete_rfp(rfp_id: str, current_user: CurrentUser = Depends(get_current_user)):
     """
     Deletes an RFP. Only the owner can delete, and only if it's a draft.
     """
@@ -268,4 +456,5 @@ async def delete_rfp(rfp_id: str, current_user: UserInDB = Depends(get_current_u
         raise HTTPException(status_code=400, detail="Cannot delete an RFP that is not a draft")
 
     rfp_collection.delete_one({"_id": obj_id})
+    rfp_version_collection.delete_many({"rfp_id": obj_id})
     return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
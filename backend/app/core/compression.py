@@ -0,0 +1,199 @@
+# FILE: backend/app/core/compression.py
+# -------------------------------------
+# This file contains the response compression middleware.
+# The encoding is negotiated from the Accept-Encoding header: brotli and
+# zstd are used when their packages are installed, gzip is always available.
+# Responses below COMPRESSION_MIN_SIZE bytes are sent as they are. Response
+# sizes, the time spent serializing (measured by TimedRoute) and the CPU time
+# spent compressing are recorded in `payload_stats`, so compression levels
+# can be tuned against bandwidth saved.
+
+import gzip
+import threading
+import time
+from starlette.datastructures import Headers, MutableHeaders
+from .config import get_settings
+from .timing import TIMINGS_SCOPE_KEY
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+def _compress(encoding: str, data: bytes) -> bytes:
+    settings = get_settings()
+    if encoding == "br":
+        return brotli.compress(data, quality=settings.brotli_quality)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=settings.zstd_level).compress(data)
+    return gzip.compress(data, compresslevel=settings.gzip_level, mtime=0)
+
+
+def available_encodings() -> list:
+    """The encodings this server can produce, in order of preference."""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def choose_encoding(accept_encoding: str):
+    """Picks the preferred encoding the client accepts, or None."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+class PayloadStats:
+    """Running totals of response sizes and timings, per encoding and per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.encodings = {}
+        self.endpoints = {}
+
+    @staticmethod
+    def _add(totals: dict, key: str, raw_bytes: int, sent_bytes: int, timings: dict, compression_cpu: float):
+        entry = totals.setdefault(key, {
+            "responses": 0, "raw_bytes": 0, "sent_bytes": 0,
+            "handler_ms": 0.0, "serialization_ms": 0.0, "compression_cpu_ms": 0.0
+        })
+        entry["responses"] += 1
+        entry["raw_bytes"] += raw_bytes
+        entry["sent_bytes"] += sent_bytes
+        entry["handler_ms"] += timings.get("handler", 0.0) * 1000
+        entry["serialization_ms"] += timings.get("serialization", 0.0) * 1000
+        entry["compression_cpu_ms"] += compression_cpu * 1000
+
+    def record(self, endpoint: str, encoding: str, raw_bytes: int, sent_bytes: int, timings: dict, compression_cpu: float):
+        with self._lock:
+            self._add(self.encodings, encoding, raw_bytes, sent_bytes, timings, compression_cpu)
+            self._add(self.endpoints, endpoint, raw_bytes, sent_bytes, timings, compression_cpu)
+
+    def snapshot(self) -> dict:
+        def summarize(entry):
+            responses = entry["responses"]
+            return {
+                **{key: round(value, 3) for key, value in entry.items()},
+                "ratio": round(entry["sent_bytes"] / entry["raw_bytes"], 3) if entry["raw_bytes"] else 1.0,
+                "avg_handler_ms": round(entry["handler_ms"] / responses, 3),
+                "avg_serialization_ms": round(entry["serialization_ms"] / responses, 3),
+                "avg_compression_cpu_ms": round(entry["compression_cpu_ms"] / responses, 3),
+            }
+
+        with self._lock:
+            return {
+                "available_encodings": available_encodings(),
+                "encodings": {key: summarize(entry) for key, entry in self.encodings.items()},
+                "endpoints": {key: summarize(entry) for key, entry in self.endpoints.items()},
+            }
+
+
+payload_stats = PayloadStats()
+
+
+class CompressionMiddleware:
+    """
+    Compresses complete (non-streamed) 200 responses with the negotiated
+    encoding. Partial content (206, or any response with Content-Range) is
+    never compressed, since its ranges refer to the uncompressed bytes.
+    Compression runs on the event loop without yielding, so the thread CPU
+    time around it is the compression cost of this response alone.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+        encoding = None
+        if settings.compression_enabled:
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+
+        start_message = None
+        streaming = False
+
+        async def send_compressed(message):
+            nonlocal start_message, streaming
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the body size is known
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or streaming:
+                await send(message)
+                return
+
+            if start_message is not None and message.get("more_body", False):
+                # Streamed responses (e.g. files) are passed through unchanged
+                streaming = True
+                await send(start_message)
+                start_message = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start_message)
+            content_type = headers.get("content-type", "")
+            compressible = (
+                start_message["status"] == 200
+                and content_type.startswith(_COMPRESSIBLE_TYPES)
+                and "content-encoding" not in headers
+                and "content-range" not in headers
+            )
+
+            raw_size = len(body)
+            sent_encoding = "identity"
+            compression_cpu = 0.0
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+                if encoding and raw_size >= settings.compression_min_size:
+                    compression_started = time.thread_time()
+                    compressed = _compress(encoding, body)
+                    compression_cpu = time.thread_time() - compression_started
+                    if len(compressed) < raw_size:
+                        headers["Content-Encoding"] = encoding
+                        headers["Content-Length"] = str(len(compressed))
+                        sent_encoding = encoding
+                        body = compressed
+                        message = {**message, "body": body}
+                # Keyed by endpoint name, so unmatched paths cannot grow the table
+                endpoint = getattr(scope.get("route"), "name", "unmatched")
+                payload_stats.record(
+                    endpoint, sent_encoding, raw_size, len(body), scope.get(TIMINGS_SCOPE_KEY, {}), compression_cpu
+                )
+
+            await send(start_message)
+            start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,143 @@
+# FILE: backend/app/core/config.py
+# --------------------------------
+# This file defines the application settings.
+# Settings are read from the environment (and the .env file) once, validated,
+# and cached. Endpoints receive them with `Depends(get_settings)`; services and
+# middleware call get_settings() at the time they need them.
+# - override_settings() replaces them for the whole process, and is what tests
+#   and benchmarks should use.
+# - app.dependency_overrides[get_settings] replaces only what endpoints
+#   receive, not what services and middleware read.
+
+import multiprocessing
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+
+
+def default_worker_count() -> int:
+    return min(multiprocessing.cpu_count() * 2 + 1, 8)
+
+
+class Settings(BaseModel):
+    # --- Database ---
+    mongo_cluster_url: str
+    database_name: str = "rfp_system"
+    mongo_max_pool_size: int = Field(50, ge=1)
+    mongo_min_pool_size: int = Field(0, ge=0)
+    mongo_wait_queue_timeout_ms: int = Field(2000, ge=1)
+    mongo_server_selection_timeout_ms: int = Field(5000, ge=1)
+    # Readiness fails above this share of busy pool connections
+    pool_saturation_threshold: float = Field(0.9, gt=0, le=1)
+
+    # --- Authentication ---
+    jwt_secret_key: str
+    jwt_algorithm: str = "HS256"
+    access_token_expire_minutes: int = Field(30, ge=1)
+    refresh_token_expire_days: int = Field(7, ge=1)
+    # Workers reload the token revocation list from MongoDB this often
+    revocation_sync_seconds: int = Field(30, ge=1)
+    revocation_bloom_capacity: int = Field(100_000, ge=1)
+    revocation_bloom_error_rate: float = Field(0.001, gt=0, lt=1)
+
+    # --- HTTP ---
+    cors_origins: List[str] = ["http://localhost:3000", "http://192.168.1.9:3000"]
+    max_upload_size_mb: int = Field(10, ge=1)
+    # Responses are compressed with the best encoding the client accepts
+    # (br, zstd when their packages are installed, otherwise gzip)
+    compression_enabled: bool = True
+    compression_min_size: int = Field(1024, ge=0)
+    gzip_level: int = Field(6, ge=1, le=9)
+    brotli_quality: int = Field(4, ge=0, le=11)
+    zstd_level: int = Field(3, ge=1, le=22)
+    # JSON GET responses carry an ETag and answer If-None-Match with 304
+    etags_enabled: bool = True
+    # Length of the text snippets returned by list endpoints with ?view=summary
+    summary_snippet_length: int = Field(280, ge=20)
+
+    # --- Server ---
+    web_concurrency: int = Field(default_factory=default_worker_count, ge=1)
+
+    # --- Caches and batch sizes ---
+    matching_index_refresh_seconds: int = Field(300, ge=0)
+    min_match_score: float = Field(0.05, ge=0, le=1)
+    ranking_cache_size: int = Field(256, ge=1)
+    max_bulk_scores: int = Field(500, ge=1)
+    version_snapshot_interval: int = Field(10, ge=1)
+
+    # --- Logging ---
+    log_level: str = "INFO"
+    log_json: bool = True
+    # Per-logger settings, written in the environment as "logger=value,logger=value"
+    log_sample_rates: Dict[str, float] = {}
+    log_rate_limits: Dict[str, float] = {"app.services.email_service": 20.0}
+
+    # --- Feature flags for the fast paths ---
+    recommendations_enabled: bool = True
+    targeted_notifications_enabled: bool = True
+    ranking_cache_enabled: bool = True
+
+    @property
+    def max_upload_size_bytes(self) -> int:
+        return self.max_upload_size_mb * 1024 * 1024
+
+
+def load_settings() -> Settings:
+    """Builds the settings from environment variables named after each field in upper case."""
+    load_dotenv()
+
+    if not os.getenv("MONGO_CLUSTER_URL"):
+        raise ValueError("MONGO_CLUSTER_URL environment variable not set!")
+    if not os.getenv("JWT_SECRET_KEY"):
+        raise ValueError("JWT_SECRET_KEY environment variable not set!")
+
+    values = {}
+    for name in Settings.model_fields:
+        value = os.getenv(name.upper())
+        if value is not None and value != "":
+            values[name] = value
+
+    # CORS_ORIGINS is a comma-separated list of URLs
+    if "cors_origins" in values:
+        values["cors_origins"] = [origin.strip() for origin in values["cors_origins"].split(",") if origin.strip()]
+
+    # LOG_SAMPLE_RATES and LOG_RATE_LIMITS map logger names to numbers
+    for name in ("log_sample_rates", "log_rate_limits"):
+        if name in values:
+            mapping = {}
+            for pair in values[name].split(","):
+                if not pair.strip():
+                    continue
+                logger, separator, value = pair.partition("=")
+                if not separator or not logger.strip() or not value.strip():
+                    raise ValueError(f"{name.upper()} entries must be written as logger=value, got '{pair.strip()}'")
+                mapping[logger.strip()] = value.strip()
+            values[name] = mapping
+
+    settings = Settings(**values)
+    if settings.mongo_min_pool_size > settings.mongo_max_pool_size:
+        raise ValueError("MONGO_MIN_POOL_SIZE cannot be larger than MONGO_MAX_POOL_SIZE")
+    return settings
+
+
+_override: Optional[Settings] = None
+
+
+@lru_cache(maxsize=None)
+def _cached_settings() -> Settings:
+    return load_settings()
+
+
+def get_settings() -> Settings:
+    """Returns the application settings. Can also be used as a FastAPI dependency."""
+    if _override is not None:
+        return _override
+    return _cached_settings()
+
+
+def override_settings(settings: Optional[Settings]):
+    """Replaces the settings for the whole process. Pass None to go back to the environment."""
+    global _override
+    _override = settings
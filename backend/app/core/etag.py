@@ -0,0 +1,83 @@
+# FILE: backend/app/core/etag.py
+# ------------------------------
+# This file contains the ETag middleware for JSON GET responses.
+# The ETag is a hash of the response body, so it changes exactly when the
+# data does. Clients revalidating a cached response with If-None-Match get
+# an empty 304 Not Modified instead of the full body.
+
+import hashlib
+from starlette.datastructures import Headers, MutableHeaders
+from .config import get_settings
+
+
+def make_etag(body: bytes) -> str:
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return etag in candidates or etag[2:] in candidates
+
+
+class ETagMiddleware:
+    """
+    Adds an ETag to complete, successful JSON responses to GET requests and
+    answers 304 when the request's If-None-Match matches it. The endpoint
+    still runs; what is saved is sending and parsing the body.
+    Must run inside CompressionMiddleware so the hash is of the plain body.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not get_settings().etags_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message = None
+        streaming = False
+
+        async def send_with_etag(message):
+            nonlocal start_message, streaming
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or streaming:
+                await send(message)
+                return
+
+            if start_message is not None and message.get("more_body", False):
+                streaming = True
+                await send(start_message)
+                start_message = None
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            if (
+                start_message["status"] == 200
+                and headers.get("content-type", "").startswith("application/json")
+                and "etag" not in headers
+            ):
+                etag = make_etag(message.get("body", b""))
+                headers["ETag"] = etag
+                # Responses depend on the user, and must be revalidated before reuse
+                headers["Cache-Control"] = "private, no-cache"
+                headers.add_vary_header("Authorization")
+                if if_none_match and etag_matches(if_none_match, etag):
+                    del headers["content-type"]
+                    del headers["content-length"]
+                    start_message["status"] = 304
+                    message = {**message, "body": b""}
+
+            await send(start_message)
+            start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
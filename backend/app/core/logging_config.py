@@ -0,0 +1,203 @@
+# FILE: backend/app/core/logging_config.py
+# ----------------------------------------
+# This file configures application logging.
+# Request handlers only put log records on an in-memory queue (QueueHandler);
+# a background thread (QueueListener) formats them as JSON lines and writes
+# them to stdout, so no I/O happens on the event loop. Every record carries
+# the id of the request that produced it. High-volume loggers can be sampled
+# and rate limited through the LOG_SAMPLE_RATES and LOG_RATE_LIMITS settings.
+
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from .config import get_settings
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes of every LogRecord; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps records with the current request id. Runs on the request's own thread."""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a random share of a logger's records."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket limiting a logger to `per_second` records on average.
+    The next record let through reports how many were dropped in between.
+    """
+
+    def __init__(self, per_second: float):
+        super().__init__()
+        self.per_second = per_second
+        self._tokens = per_second
+        self._updated = time.monotonic()
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.per_second, self._tokens + (now - self._updated) * self.per_second)
+            self._updated = now
+            if self._tokens < 1:
+                self._suppressed += 1
+                return False
+            self._tokens -= 1
+            if self._suppressed:
+                record.suppressed = self._suppressed
+                self._suppressed = 0
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record, including any `extra` fields, as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+            "pid": record.process,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+_traceback_formatter = logging.Formatter()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # Formatting happens on the listener thread. Here the message is only
+        # resolved and a traceback turned into text, so the record no longer
+        # refers to objects the request may still change.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_queue_handler = None
+_listener = None
+
+
+def _start_listener():
+    global _listener
+    settings = get_settings()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.log_json:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s"
+        ))
+    log_queue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _restart_listener_after_fork():
+    # The listener thread does not survive fork(), so each worker starts its own
+    if _queue_handler is not None:
+        _start_listener()
+
+
+def setup_logging():
+    """Installs the queue-based handler on the root logger. Safe to call more than once."""
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+
+    settings = get_settings()
+    _queue_handler = _QueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.log_level.upper())
+
+    for name, rate in settings.log_sample_rates.items():
+        logging.getLogger(name).addFilter(SamplingFilter(rate))
+    for name, per_second in settings.log_rate_limits.items():
+        logging.getLogger(name).addFilter(RateLimitFilter(per_second))
+
+    _start_listener()
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+def shutdown_logging():
+    """Writes out any queued records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """
+    Gives every request an id, taken from the X-Request-ID header or newly
+    generated, that is attached to its log records and echoed in the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
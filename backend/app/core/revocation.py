@@ -0,0 +1,138 @@
+# FILE: backend/app/core/revocation.py
+# ------------------------------------
+# This file keeps track of revoked tokens.
+# Revocations are stored in MongoDB so every worker sees them. Each worker
+# keeps an in-memory bloom filter of the revoked token ids, rebuilt from
+# MongoDB every `revocation_sync_seconds`, so checking a valid token (the
+# common case) needs no database lookup. Only a bloom filter hit is
+# confirmed against the database. Refreshing a token bypasses the filter,
+# since a refresh token revoked on another worker must never be accepted.
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from pymongo.errors import DuplicateKeyError
+from ..db.database import revoked_token_collection
+from .config import get_settings
+
+
+class BloomFilter:
+    """Fixed-size bloom filter using double hashing over a BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationList:
+    """
+    Revoked token ids and per-user revocations.
+    - revoke_token() revokes a single token, e.g. on logout.
+    - revoke_user() revokes every token issued to a user so far. Anything
+      that changes a claim carried by the tokens (such as the role or
+      username) must call it, so the old claims stop being accepted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._user_revoked_at: Dict[str, float] = {}
+        self._synced_at = None
+
+    def _sync_if_due(self):
+        settings = get_settings()
+        now = time.monotonic()
+        if self._synced_at is not None and now - self._synced_at < settings.revocation_sync_seconds:
+            return
+        with self._lock:
+            if self._synced_at is not None and now - self._synced_at < settings.revocation_sync_seconds:
+                return
+            bloom = BloomFilter(settings.revocation_bloom_capacity, settings.revocation_bloom_error_rate)
+            user_revoked_at = {}
+            entries = revoked_token_collection.find(
+                {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+                {"jti": 1, "user_id": 1, "revoked_at": 1}
+            )
+            for entry in entries:
+                if "jti" in entry:
+                    bloom.add(entry["jti"])
+                else:
+                    user_revoked_at[entry["user_id"]] = entry["revoked_at"]
+            self._bloom = bloom
+            self._user_revoked_at = user_revoked_at
+            self._synced_at = now
+
+    def revoke_token(self, jti: str, expires_at: datetime) -> bool:
+        """
+        Revokes a single token until it would have expired anyway.
+        Returns False if it was already revoked. The unique index on `jti`
+        makes this atomic across workers, so a refresh token can be used once.
+        """
+        try:
+            result = revoked_token_collection.update_one(
+                {"jti": jti},
+                {"$setOnInsert": {"jti": jti, "expires_at": expires_at}},
+                upsert=True
+            )
+            newly_revoked = result.upserted_id is not None
+        except DuplicateKeyError:
+            # A concurrent request revoked it first
+            newly_revoked = False
+        self._sync_if_due()
+        self._bloom.add(jti)
+        return newly_revoked
+
+    def revoke_user(self, user_id: str):
+        """Revokes every token issued to the user up to now."""
+        settings = get_settings()
+        # Tokens carry a sub-second `iat`, so one issued right after this is not affected
+        revoked_at = time.time()
+        revoked_token_collection.update_one(
+            {"user_id": user_id},
+            {"$set": {
+                "user_id": user_id,
+                "revoked_at": revoked_at,
+                # No token issued before now outlives the refresh token lifetime
+                "expires_at": datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
+            }},
+            upsert=True
+        )
+        self._sync_if_due()
+        self._user_revoked_at[user_id] = revoked_at
+
+    def is_revoked(self, claims: dict) -> bool:
+        self._sync_if_due()
+        revoked_at = self._user_revoked_at.get(claims["sub"])
+        if revoked_at is not None and claims["iat"] < revoked_at:
+            return True
+        if claims["jti"] not in self._bloom:
+            return False
+        # Possible false positive: confirm with the database
+        return revoked_token_collection.find_one({"jti": claims["jti"]}, {"_id": 1}) is not None
+
+    def is_user_revoked(self, claims: dict) -> bool:
+        """Checks the database, not the synced copy, for a revocation of all the user's tokens."""
+        return revoked_token_collection.find_one(
+            {"user_id": claims["sub"], "revoked_at": {"$gt": claims["iat"]}},
+            {"_id": 1}
+        ) is not None
+
+
+revocation_list = RevocationList()
@@ -2,57 +2,93 @@
 # ----------------------------------
 # This file contains security-related utility functions.
 
-from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-import os
+from functools import lru_cache
+from uuid import uuid4
 from jose import JWTError, jwt
-from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from ..db.database import user_collection
-from ..models.user_model import UserInDB
-from ..models.token_model import TokenData
-from bson import ObjectId
+from pydantic import ValidationError
+from .config import get_settings
+from .revocation import revocation_list
+from ..models.user_model import CurrentUser
 
-load_dotenv()
-
-SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-ALGORITHM = os.getenv("JWT_ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
-
-# Use bcrypt for password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    Returns the bcrypt password context.
+    passlib and its bcrypt backend are imported on first use rather than at
+    startup, since only the login and register endpoints need them.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+# For endpoints where the access token is optional, such as logout
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed one."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hashes a plain password."""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 
+def user_claims(user: dict) -> dict:
+    """
+    Returns the claims stored in a user's access token. They hold everything
+    the routers need, so verifying a token needs no database lookup.
+    """
+    return {
+        "sub": str(user["_id"]),
+        "email": user["email"],
+        "username": user["username"],
+        "role": user["role"],
+    }
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Creates a new JWT access token."""
     to_encode = data.copy()
+    now = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        expire = now + timedelta(minutes=15)
+    to_encode.setdefault("type", "access")
+    # jti identifies the token so it can be revoked individually. iat keeps
+    # its fractions of a second, so revoking a user's tokens does not also
+    # reject the ones issued later in the same second.
+    to_encode.update({"exp": expire, "iat": now.timestamp(), "jti": uuid4().hex})
+    settings = get_settings()
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
+def create_token_pair(user: dict) -> dict:
+    """Creates an access token and a longer-lived refresh token for a user."""
+    settings = get_settings()
+    access_token = create_access_token(
+        data=user_claims(user),
+        expires_delta=timedelta(minutes=settings.access_token_expire_minutes)
+    )
+    refresh_token = create_access_token(
+        data={"sub": str(user["_id"]), "type": "refresh"},
+        expires_delta=timedelta(days=settings.refresh_token_expire_days)
+    )
+    return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
+
+
+def decode_token(token: str, token_type: str = "access", verify_exp: bool = True) -> dict:
     """
-    Decodes JWT token to get the current user.
-    This function is a dependency for protected endpoints.
+    Verifies a token's signature, expiry, type and revocation and returns its claims.
+    Raises a 401 error if the token is not valid.
+    With verify_exp=False an expired token is accepted, e.g. to log it out.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,17 +96,39 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
+        settings = get_settings()
+        payload = jwt.decode(
+            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm],
+            options={"verify_exp": verify_exp}
+        )
     except JWTError:
         raise credentials_exception
 
-    user = user_collection.find_one({"email": token_data.email})
-    if user is None:
+    if payload.get("type") != token_type or not all(payload.get(claim) for claim in ("sub", "jti", "iat")):
         raise credentials_exception
+    if revocation_list.is_revoked(payload):
+        raise credentials_exception
+
+    return payload
+
 
-    user["id"] = str(user["_id"])
-    return UserInDB(**user)
\ No newline at end of file
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
+    """
+    Decodes JWT token to get the current user.
+    This function is a dependency for protected endpoints.
+    """
+    payload = decode_token(token)
+    try:
+        return CurrentUser(
+            id=payload["sub"],
+            username=payload.get("username"),
+            email=payload.get("email"),
+            role=payload.get("role"),
+        )
+    except ValidationError:
+        # Tokens issued before the claims were added do not carry them
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
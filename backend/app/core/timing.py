@@ -0,0 +1,81 @@
+# FILE: backend/app/core/timing.py
+# --------------------------------
+# This file contains the route class that times endpoints.
+# Routers created with `APIRouter(route_class=TimedRoute)` record, for each
+# request, how long the route took and how much of that was spent after the
+# endpoint returned: validating the result against the response model and
+# serializing it to JSON. CompressionMiddleware adds both to `payload_stats`.
+
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Optional
+from fastapi.routing import APIRoute
+
+# Key of the timings in the ASGI scope, where the middleware reads them
+TIMINGS_SCOPE_KEY = "app.timings"
+
+_endpoint_returned_at: ContextVar[Optional[list]] = ContextVar("endpoint_returned_at", default=None)
+
+
+def _record_return():
+    marker = _endpoint_returned_at.get()
+    if marker is not None:
+        marker.append(time.perf_counter())
+
+
+def _timed_endpoint(endpoint):
+    """Wraps an endpoint to note when it returns. FastAPI still sees the original signature."""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _record_return()
+    else:
+        @functools.wraps(endpoint)
+        def timed(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _record_return()
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """
+    Records into the request scope:
+    - `handler`: seconds from the start of the route (dependencies included)
+      until the response was built.
+    - `serialization`: seconds from the endpoint's return until the response
+      was built. For `async def` endpoints this runs without giving up the
+      event loop, so it is the CPU cost of validating and serializing the
+      result. For plain `def` endpoints validation runs in the threadpool and
+      the figure can include waiting for a thread.
+    These are wall-clock times; `handler` includes any time the request
+    spent waiting, e.g. for MongoDB or an upload.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            returned_at = []
+            token = _endpoint_returned_at.set(returned_at)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                finished = time.perf_counter()
+                _endpoint_returned_at.reset(token)
+                request.scope[TIMINGS_SCOPE_KEY] = {
+                    "handler": finished - started,
+                    "serialization": finished - returned_at[-1] if returned_at else 0.0,
+                }
+
+        return timed_handler
@@ -0,0 +1,19 @@
+# FILE: backend/app/core/uploads.py
+# ---------------------------------
+# This file contains checks shared by the endpoints that accept file uploads.
+
+from fastapi import HTTPException, UploadFile
+from .config import get_settings
+
+
+def ensure_upload_size(file: UploadFile):
+    """Rejects uploads larger than the MAX_UPLOAD_SIZE_MB setting."""
+    settings = get_settings()
+    file.file.seek(0, 2)
+    size = file.file.tell()
+    file.file.seek(0)
+    if size > settings.max_upload_size_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File is larger than the {settings.max_upload_size_mb} MB limit."
+        )
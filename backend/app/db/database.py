@@ -1,22 +1,173 @@
 # FILE: backend/app/db/database.py
 # --------------------------------
 # This file handles the MongoDB connection.
+# The client is created lazily, once per process. A MongoClient must not be
+# shared across fork(), so when the server runs several workers each worker
+# opens its own connection pool on first use. Collections declare their
+# indexes, which each process creates the first time it uses the collection.
 
+import logging
 import os
-from pymongo import MongoClient
-from dotenv import load_dotenv
+import threading
+from pymongo import MongoClient, monitoring
+from pymongo.errors import PyMongoError
+from ..core.config import get_settings
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-MONGO_CLUSTER_URL = os.getenv("MONGO_CLUSTER_URL")
 
-if not MONGO_CLUSTER_URL:
-    raise ValueError("MONGO_CLUSTER_URL environment variable not set!")
+class PoolStats(monitoring.ConnectionPoolListener):
+    """Tracks connection pool usage so the readiness check can report saturation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.checked_out = {}
+        self.open_connections = {}
+        self.wait_queue_timeouts = 0
+
+    def _add(self, counter: dict, address, amount: int):
+        with self._lock:
+            counter[address] = counter.get(address, 0) + amount
+
+    def connection_checked_out(self, event):
+        self._add(self.checked_out, event.address, 1)
+
+    def connection_checked_in(self, event):
+        self._add(self.checked_out, event.address, -1)
+
+    def connection_created(self, event):
+        self._add(self.open_connections, event.address, 1)
+
+    def connection_closed(self, event):
+        self._add(self.open_connections, event.address, -1)
+
+    def connection_check_out_failed(self, event):
+        if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+            with self._lock:
+                self.wait_queue_timeouts += 1
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.checked_out.pop(event.address, None)
+
+    def pool_closed(self, event):
+        with self._lock:
+            self.checked_out.pop(event.address, None)
+            self.open_connections.pop(event.address, None)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            busiest = max(self.checked_out.values(), default=0)
+            max_pool_size = get_settings().mongo_max_pool_size
+            return {
+                "max_pool_size": max_pool_size,
+                "checked_out": sum(self.checked_out.values()),
+                "open_connections": sum(self.open_connections.values()),
+                "wait_queue_timeouts": self.wait_queue_timeouts,
+                # Usage of the busiest server's pool, from 0 to 1
+                "saturation": round(busiest / max_pool_size, 3),
+            }
+
+
+pool_stats = PoolStats()
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> MongoClient:
+    """Returns the MongoClient of the current process, creating it on first use."""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                settings = get_settings()
+                pool_stats.reset()
+                _client = MongoClient(
+                    settings.mongo_cluster_url,
+                    maxPoolSize=settings.mongo_max_pool_size,
+                    minPoolSize=settings.mongo_min_pool_size,
+                    waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
+                    serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+                    event_listeners=[pool_stats],
+                )
+                _client_pid = pid
+    return _client
+
+
+def close_client():
+    """Closes the client of the current process, if one was created."""
+    global _client, _client_pid
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+        _client_pid = None
+
+
+class LazyCollection:
+    """
+    Stands in for a pymongo Collection and resolves it from the current
+    process's client on each use, so modules can keep importing collections
+    at import time without opening a connection before the workers fork.
+    `indexes` is a list of (keys, options) pairs passed to create_index().
+    """
+
+    def __init__(self, name: str, indexes: list = ()):
+        self._name = name
+        self._indexes = indexes
+        self._client = None
+        self._collection = None
+
+    def _ensure_indexes(self, collection):
+        # create_index() does nothing for an index that already exists
+        for keys, options in self._indexes:
+            try:
+                collection.create_index(keys, **options)
+            except PyMongoError:
+                logger.exception("Could not create index", extra={"collection": self._name, "keys": str(keys)})
+
+    def _resolve(self):
+        client = get_client()
+        if client is not self._client:
+            collection = client[get_settings().database_name].get_collection(self._name)
+            self._ensure_indexes(collection)
+            self._collection = collection
+            self._client = client
+        return self._collection
+
+    def __getattr__(self, attribute):
+        return getattr(self._resolve(), attribute)
 
-client = MongoClient(MONGO_CLUSTER_URL)
-database = client.rfp_system # The database name
 
 # Get collections
-user_collection = database.get_collection("users")
-rfp_collection = database.get_collection("rfps")
-response_collection = database.get_collection("responses")
+user_collection = LazyCollection("users")
+rfp_collection = LazyCollection("rfps")
+response_collection = LazyCollection("responses")
+rfp_version_collection = LazyCollection("rfp_versions", indexes=[
+    ([("rfp_id", 1), ("version", 1)], {"unique": True}),
+    ([("rfp_id", 1), ("document_hash", 1)], {}),
+])
+revoked_token_collection = LazyCollection("revoked_tokens", indexes=[
+    # MongoDB deletes entries once the tokens they revoke have expired
+    ([("expires_at", 1)], {"expireAfterSeconds": 0}),
+    ([("jti", 1)], {"unique": True, "partialFilterExpression": {"jti": {"$exists": True}}}),
+    ([("user_id", 1)], {"unique": True, "partialFilterExpression": {"user_id": {"$exists": True}}}),
+])
@@ -1,10 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from .apis import auth, rfps, responses
-from .db.database import client
-import os
+from .apis import auth, rfps, responses, evaluations, health
+from .db.database import close_client
+from .core.config import get_settings
+from .core.logging_config import setup_logging, shutdown_logging, RequestIdMiddleware
+from .core.compression import CompressionMiddleware
+from .core.etag import ETagMiddleware
 from pathlib import Path
+import logging
+
+# Route all log records through the background logging queue
+setup_logging()
+logger = logging.getLogger(__name__)
 
 # Define the base directory of the backend project
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -22,46 +30,44 @@ app = FastAPI(
 
 app.mount("/uploads", StaticFiles(directory=BASE_DIR / "uploads"), name="uploads")
 
-# --- CORS Middleware Configuration ---
-# Read allowed origins from an environment variable.
-# The variable should be a comma-separated string of URLs.
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000")
-
-origins = [origin.strip() for origin in CORS_ORIGINS.split(",")]
-origins.append("http://192.168.1.9:3000") # local network pc
+# --- Response Compression and ETags ---
+# JSON GET responses carry an ETag, so unchanged data can be answered with 304.
+# Added first so it runs innermost and hashes the uncompressed body.
+app.add_middleware(ETagMiddleware)
+# JSON responses of at least COMPRESSION_MIN_SIZE bytes are sent compressed
+# with br, zstd or gzip, whichever the client accepts and is available.
+app.add_middleware(CompressionMiddleware)
 
+# --- CORS Middleware Configuration ---
+# Allowed origins come from the CORS_ORIGINS setting (a comma-separated list of URLs).
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "ETag"],
 )
 
+# Added last so it runs first: every request, including CORS preflights, gets an id
+app.add_middleware(RequestIdMiddleware)
+
 # --- Routers ---
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(rfps.router, prefix="/api/rfps", tags=["RFPs"])
 app.include_router(responses.router, prefix="/api/rfps", tags=["Responses"])
+app.include_router(evaluations.router, prefix="/api/rfps", tags=["Evaluation"])
+app.include_router(health.router, prefix="/health", tags=["Health"])
 
-@app.on_event("startup")
-def startup_db_client():
-    """Connect to the database and create uploads directory on startup."""
-    try:
-        client.admin.command('ping')
-        print("Successfully connected to MongoDB.")
-        # Create uploads directory using an absolute path
-        uploads_dir = BASE_DIR / "uploads"
-        if not uploads_dir.exists():
-            uploads_dir.mkdir()
-            print(f"Created '{uploads_dir}' directory.")
-    except Exception as e:
-        print(f"Error connecting to MongoDB: {e}")
+# No database work happens at startup: each worker opens its connection pool
+# on the first request, and /health/ready reports whether MongoDB is reachable.
 
 @app.on_event("shutdown")
 def shutdown_db_client():
     """Close the database connection on shutdown."""
-    client.close()
-    print("MongoDB connection closed.")
+    close_client()
+    logger.info("MongoDB connection closed.")
+    shutdown_logging()
 
 @app.get("/", tags=["Root"])
 def read_root():
@@ -0,0 +1,41 @@
+# FILE: backend/app/models/evaluation_model.py
+# --------------------------------------------
+# This file defines the Pydantic models for evaluating RFP responses.
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal
+
+class EvaluationCriterion(BaseModel):
+    # Names are used as field names in MongoDB, so dots and '$' are not allowed
+    name: str = Field(..., min_length=1, max_length=50, pattern=r"^[^.$]+$")
+    weight: float = Field(..., gt=0)
+    max_score: float = Field(10, gt=0)
+
+class EvaluationCriteriaUpdate(BaseModel):
+    criteria: List[EvaluationCriterion] = Field(..., min_length=1, max_length=20)
+
+class ResponseScoresUpdate(BaseModel):
+    scores: Dict[str, float]
+
+class BulkScoreItem(ResponseScoresUpdate):
+    response_id: str
+
+class BulkScoresUpload(BaseModel):
+    items: List[BulkScoreItem] = Field(..., min_length=1)
+
+class ScoresResult(BaseModel):
+    updated: int
+
+class RankedResponse(BaseModel):
+    response_id: str
+    supplier_id: str
+    status: Literal["Submitted", "Approved", "Rejected"]
+    scores: Dict[str, float]
+    total: float # Weighted total normalized to 0-100
+    percentile: float # Share of responses with the same or a lower total
+    rank: int
+
+class ResponseRanking(BaseModel):
+    rfp_id: str
+    criteria: List[EvaluationCriterion]
+    responses: List[RankedResponse]
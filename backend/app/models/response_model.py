@@ -20,6 +20,7 @@ class ResponsePublic(ResponseBase):
     status: Literal["Submitted", "Approved", "Rejected"]
     submitted_at: datetime
     rfp_title: Optional[str] = None # Add optional title field
+    response_text_length: Optional[int] = None # Set in the summary view, where response_text is a snippet
 
 class ResponseStatusUpdate(BaseModel):
     status: Literal["Approved", "Rejected"]
\ No newline at end of file
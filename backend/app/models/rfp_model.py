@@ -4,7 +4,7 @@
 
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Literal, List
+from typing import Literal, List, Optional
 
 class RFPBase(BaseModel):
     title: str = Field(..., min_length=5, max_length=100)
@@ -20,6 +20,10 @@ class RFPPublic(RFPBase):
     document_url: str | None = None # Add document_url field
     created_at: datetime
     updated_at: datetime
+    description_length: Optional[int] = None # Set in the summary view, where description is a snippet
+
+class RFPRecommendation(RFPPublic):
+    match_score: float
 
 class RFPStatusUpdate(BaseModel):
     status: Literal["Draft", "Published", "Under Review", "Approved", "Rejected", "Response Submitted"]
\ No newline at end of file
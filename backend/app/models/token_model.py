@@ -6,7 +6,12 @@ from pydantic import BaseModel
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str | None = None
     token_type: str
 
-class TokenData(BaseModel):
-    email: str | None = None
\ No newline at end of file
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
+    all_sessions: bool = False # Also revoke every other token issued to the user
\ No newline at end of file
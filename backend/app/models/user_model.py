@@ -3,7 +3,7 @@
 # This file defines the Pydantic models for user data
 
 from pydantic import BaseModel, EmailStr, Field
-from typing import Literal
+from typing import List, Literal
 
 class UserBase(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
@@ -13,9 +13,23 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str = Field(..., min_length=6)
 
+# Capabilities are only set through PUT /me/capabilities, which normalizes
+# them, so they are not part of UserCreate
 class UserInDB(UserBase):
     id: str
     hashed_password: str
+    capabilities: List[str] = [] # Supplier keywords used for RFP matching
 
 class UserPublic(UserBase):
-    id: str
\ No newline at end of file
+    id: str
+    capabilities: List[str] = []
+
+class CurrentUser(BaseModel):
+    """The identity carried in an access token, available without a database lookup."""
+    id: str
+    username: str
+    email: EmailStr
+    role: Literal["Buyer", "Supplier"]
+
+class CapabilitiesUpdate(BaseModel):
+    capabilities: List[str] = Field(..., max_length=50)
@@ -0,0 +1,32 @@
+# FILE: backend/app/models/version_model.py
+# -----------------------------------------
+# This file defines the Pydantic models for RFP version history.
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+class RFPVersionSummary(BaseModel):
+    version: int
+    title: str
+    document_url: Optional[str] = None
+    document_hash: Optional[str] = None
+    is_snapshot: bool
+    created_by: Optional[str] = None
+    created_at: datetime
+
+class RFPVersionPublic(RFPVersionSummary):
+    rfp_id: str
+    description: str
+
+class RFPVersionDiff(BaseModel):
+    rfp_id: str
+    from_version: int
+    to_version: int
+    title_from: str
+    title_to: str
+    document_changed: bool
+    total_lines: int
+    offset: int
+    limit: int
+    lines: List[str]
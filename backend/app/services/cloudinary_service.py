@@ -2,13 +2,28 @@
 # ------------------------------------------------
 # This service handles all interactions with the Cloudinary API.
 
-import cloudinary
-import cloudinary.uploader
-from dotenv import load_dotenv
+import logging
+from functools import lru_cache
 from pathlib import Path
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_uploader():
+    """
+    Imports and configures the Cloudinary SDK on first use.
+    The SDK is slow to import and only the upload endpoints need it.
+    It reads CLOUDINARY_URL from the environment, which get_settings()
+    has already populated from the .env file.
+    """
+    get_settings()
+    import cloudinary
+    import cloudinary.uploader
+    cloudinary.config(secure=True)
+    return cloudinary.uploader
 
-load_dotenv()
-cloudinary.config(secure=True)
 
 def upload_file(file, folder: str, original_filename: str):
     """
@@ -19,7 +34,7 @@ def upload_file(file, folder: str, original_filename: str):
         filename_base = Path(original_filename).stem
         file_ext = Path(original_filename).suffix
 
-        upload_result = cloudinary.uploader.upload(
+        upload_result = get_uploader().upload(
             file,
             folder=folder,
             public_id=filename_base+file_ext, # Use the original name as the base ID
@@ -41,6 +56,6 @@ def upload_file(file, folder: str, original_filename: str):
         else:
             return secure_url
 
-    except Exception as e:
-        print(f"Error interacting with Cloudinary: {e}")
+    except Exception:
+        logger.exception("Error interacting with Cloudinary", extra={"folder": folder, "original_filename": original_filename})
         return None
\ No newline at end of file
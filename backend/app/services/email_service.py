@@ -1,15 +1,16 @@
 # FILE: backend/app/services/email_service.py
 # -------------------------------------------
-# This file simulates sending emails by logging to the console.
+# This file simulates sending emails by logging them.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 def send_email_simulation(to_email: str, subject: str, body: str):
     """
-    Simulates sending an email by printing the details to the console.
+    Simulates sending an email by logging its details as one structured record.
     In a real application, this function would contain the logic to
     connect to a service like SendGrid or AWS SES and send the email.
     """
-    print("--- SIMULATING EMAIL ---")
-    print(f"To: {to_email}")
-    print(f"Subject: {subject}")
-    print(f"Body: {body}")
-    print("------------------------")
\ No newline at end of file
+    logger.info("Simulated email", extra={"to": to_email, "subject": subject, "body": body})
@@ -0,0 +1,274 @@
+# FILE: backend/app/services/matching_service.py
+# ----------------------------------------------
+# This service matches suppliers to RFPs.
+# It keeps an in-memory TF-IDF index of all open RFPs as sparse per-term
+# postings, and scores a supplier's capability keywords by walking only the
+# postings of those keywords (cosine similarity).
+
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+from ..db.database import rfp_collection
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ["Published", "Response Submitted"]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or our that the
+    this to we will with you your all any can may must should not no into per
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercases text and splits it into terms, dropping stop words."""
+    return [
+        term for term in _TOKEN_RE.findall(text.lower())
+        if len(term) > 1 and term not in _STOP_WORDS
+    ]
+
+
+def rfp_terms(rfp: dict) -> List[str]:
+    # The title is counted twice so it weighs more than the description
+    return tokenize(rfp["title"]) * 2 + tokenize(rfp.get("description", ""))
+
+
+def capability_terms(capabilities: Iterable[str]) -> List[str]:
+    terms = []
+    for capability in capabilities:
+        terms.extend(tokenize(capability))
+    return terms
+
+
+@lru_cache(maxsize=1024)
+def _sublinear_tf(count: int) -> float:
+    # Cached so the postings share one float object per distinct count
+    return 1 + math.log(count)
+
+
+class _Postings:
+    """
+    Sparse TF-IDF vectors of RFPs, stored per term.
+    `_postings` maps each term to the sublinear term frequency of every RFP
+    containing it, and `_norms` holds each RFP's vector norm. The norm of an
+    RFP is computed with the IDF at the time it is added, so adding or
+    removing one RFP only touches that RFP's entries; the norms of the others
+    catch up at the next full rebuild.
+    """
+
+    # Share of RFPs added or removed since the build after which the norms are stale
+    MAX_DRIFT = 0.1
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._norms: Dict[str, float] = {}
+        self._changes = 0
+
+    @classmethod
+    def build(cls, rfps: Iterable[dict]) -> "_Postings":
+        postings = cls()
+        for rfp in rfps:
+            postings.add(str(rfp["_id"]), rfp_terms(rfp), compute_norm=False)
+        # Norms are computed once every document frequency is known
+        idf = {term: postings.idf(term) for term in postings._postings}
+        for rfp_id, terms in postings._terms.items():
+            postings._norms[rfp_id] = math.sqrt(sum(
+                (postings._postings[term][rfp_id] * idf[term]) ** 2 for term in terms
+            ))
+        return postings
+
+    @property
+    def drifted(self) -> bool:
+        return self._changes > self.MAX_DRIFT * len(self._terms)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, rfp_id: str) -> bool:
+        return rfp_id in self._terms
+
+    def idf(self, term: str) -> float:
+        return math.log((1 + len(self._terms)) / (1 + len(self._postings[term]))) + 1
+
+    def _norm(self, rfp_id: str) -> float:
+        return math.sqrt(sum(
+            (self._postings[term][rfp_id] * self.idf(term)) ** 2 for term in self._terms[rfp_id]
+        ))
+
+    def add(self, rfp_id: str, terms: List[str], compute_norm: bool = True):
+        if rfp_id in self._terms:
+            self.remove(rfp_id)
+        term_counts = Counter(terms)
+        for term, count in term_counts.items():
+            self._postings.setdefault(term, {})[rfp_id] = _sublinear_tf(count)
+        self._terms[rfp_id] = tuple(term_counts)
+        if compute_norm:
+            self._norms[rfp_id] = self._norm(rfp_id)
+            self._changes += 1
+
+    def remove(self, rfp_id: str):
+        for term in self._terms.pop(rfp_id, ()):
+            posting = self._postings[term]
+            del posting[rfp_id]
+            if not posting:
+                del self._postings[term]
+        if self._norms.pop(rfp_id, None) is not None:
+            self._changes += 1
+
+    def query_weights(self, terms: Iterable[str]) -> Dict[str, float]:
+        """The normalized weights of a keyword query, over the indexed terms only."""
+        weights = {term: self.idf(term) for term in set(terms) if term in self._postings}
+        norm = math.sqrt(sum(weight ** 2 for weight in weights.values()))
+        return {term: weight / norm for term, weight in weights.items()} if norm > 0 else {}
+
+    def rfp_weights(self, rfp_id: str) -> Dict[str, float]:
+        """The normalized TF-IDF vector of one RFP."""
+        norm = self._norms[rfp_id]
+        if norm == 0:
+            return {}
+        return {term: self._postings[term][rfp_id] * self.idf(term) / norm for term in self._terms[rfp_id]}
+
+    def scores(self, query: Dict[str, float]) -> Dict[str, float]:
+        """Cosine similarity of the query with every RFP sharing a term with it."""
+        scores = defaultdict(float)
+        for term, weight in query.items():
+            weight *= self.idf(term)
+            for rfp_id, tf in self._postings[term].items():
+                scores[rfp_id] += weight * tf
+        # Norms lag the IDF slightly until the next rebuild, which could push a score past 1
+        return {
+            rfp_id: min(score / self._norms[rfp_id], 1.0)
+            for rfp_id, score in scores.items() if self._norms[rfp_id] > 0
+        }
+
+
+class MatchingIndex:
+    """
+    TF-IDF index over the open RFPs.
+    Publishing or closing an RFP updates only that RFP's postings. Every
+    `matching_index_refresh_seconds` the index is rebuilt from the database
+    in a background thread, which picks up changes made by other server
+    processes and recomputes the norms. It also runs early once enough RFPs
+    changed for the norms to drift. Requests keep using the current index
+    until the new one is swapped in; only the first load happens on the
+    request path.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = _Postings()
+        self._loaded_at = None
+        # Changes made while a rebuild runs, replayed onto the rebuilt index
+        self._pending = None
+
+    # --- Building the index ---
+
+    @staticmethod
+    def _load() -> _Postings:
+        return _Postings.build(rfp_collection.find(
+            {"status": {"$in": OPEN_STATUSES}},
+            {"title": 1, "description": 1}
+        ))
+
+    def _ensure_loaded(self):
+        """Loads the index on first use and starts a background rebuild when it is due."""
+        if self._loaded_at is None:
+            self._postings = self._load()
+            self._loaded_at = time.monotonic()
+            return
+        refresh_seconds = get_settings().matching_index_refresh_seconds
+        due = self._postings.drifted or time.monotonic() - self._loaded_at > refresh_seconds
+        if self._pending is None and due:
+            self._pending = []
+            threading.Thread(target=self._rebuild, name="matching-index-rebuild", daemon=True).start()
+
+    def _rebuild(self):
+        try:
+            postings = self._load()
+        except Exception:
+            logger.exception("Rebuilding the matching index failed")
+            with self._lock:
+                self._pending = None
+                self._loaded_at = time.monotonic()
+            return
+
+        with self._lock:
+            for change in self._pending:
+                change(postings)
+            self._postings = postings
+            self._pending = None
+            self._loaded_at = time.monotonic()
+
+    def _apply(self, change):
+        # Callers check for a due rebuild first, so a rebuild reading the
+        # database before this change is written still replays it
+        change(self._postings)
+        if self._pending is not None:
+            self._pending.append(change)
+
+    def add_rfp(self, rfp: dict):
+        """Adds or re-indexes an open RFP."""
+        rfp_id, terms = str(rfp["_id"]), rfp_terms(rfp)
+        with self._lock:
+            self._ensure_loaded()
+            self._apply(lambda postings: postings.add(rfp_id, terms))
+
+    def remove_rfp(self, rfp_id):
+        """Removes an RFP that is no longer open from the index."""
+        rfp_id = str(rfp_id)
+        with self._lock:
+            if self._loaded_at is not None:
+                self._apply(lambda postings: postings.remove(rfp_id))
+
+    # --- Scoring ---
+
+    def recommend(self, capabilities: Iterable[str], limit: int = 10) -> List[Tuple[str, float]]:
+        """Returns the ids and scores of the open RFPs best matching the capabilities."""
+        with self._lock:
+            self._ensure_loaded()
+            postings = self._postings
+            scores = postings.scores(postings.query_weights(capability_terms(capabilities)))
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(rfp_id, score) for rfp_id, score in top if score > 0]
+
+    def match_suppliers(self, rfp: dict, suppliers: Iterable[dict]) -> List[dict]:
+        """
+        Returns the suppliers whose capabilities match the RFP.
+        The RFP must already be in the index. Suppliers without capabilities
+        have not opted into targeting yet and are always returned.
+        """
+        suppliers = list(suppliers)
+        profiled = [supplier for supplier in suppliers if supplier.get("capabilities")]
+        matched = [supplier for supplier in suppliers if not supplier.get("capabilities")]
+        if not profiled:
+            return matched
+
+        with self._lock:
+            self._ensure_loaded()
+            postings = self._postings
+            rfp_id = str(rfp["_id"])
+            if rfp_id not in postings:
+                return suppliers
+            rfp_vector = postings.rfp_weights(rfp_id)
+            profiles = [postings.query_weights(capability_terms(supplier["capabilities"])) for supplier in profiled]
+
+        min_score = get_settings().min_match_score
+        for supplier, profile in zip(profiled, profiles):
+            score = sum(weight * rfp_vector.get(term, 0.0) for term, weight in profile.items())
+            if score >= min_score:
+                matched.append(supplier)
+        return matched
+
+
+matching_index = MatchingIndex()
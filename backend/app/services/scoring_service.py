@@ -0,0 +1,93 @@
+# FILE: backend/app/services/scoring_service.py
+# ---------------------------------------------
+# This service ranks the responses to an RFP by the buyer's weighted
+# evaluation criteria. All responses are scored at once with NumPy, and the
+# result is cached per RFP until its `ranking_revision` changes.
+
+import threading
+from collections import OrderedDict
+from typing import List
+import numpy as np
+from ..db.database import rfp_collection
+from ..core.config import get_settings
+
+
+def bump_revision(rfp_id):
+    """Marks the cached ranking of an RFP as stale."""
+    rfp_collection.update_one({"_id": rfp_id}, {"$inc": {"ranking_revision": 1}})
+
+
+def rank_responses(criteria: List[dict], responses: List[dict]) -> List[dict]:
+    """
+    Computes the weighted total, percentile and rank of every response.
+    Scores are normalized by each criterion's max_score and weights are
+    normalized to sum to 1, so totals range from 0 to 100. Missing scores
+    count as 0.
+    """
+    if not responses:
+        return []
+
+    names = [criterion["name"] for criterion in criteria]
+    max_scores = np.array([criterion["max_score"] for criterion in criteria], dtype=np.float64)
+    weights = np.array([criterion["weight"] for criterion in criteria], dtype=np.float64)
+    weights /= weights.sum()
+
+    scores = np.zeros((len(responses), len(names)), dtype=np.float64)
+    for row, response in enumerate(responses):
+        response_scores = response.get("scores") or {}
+        for column, name in enumerate(names):
+            scores[row, column] = response_scores.get(name, 0.0)
+
+    totals = np.clip(scores / max_scores, 0, 1) @ weights * 100
+
+    sorted_totals = np.sort(totals)
+    at_or_below = np.searchsorted(sorted_totals, totals, side="right")
+    percentiles = at_or_below / len(totals) * 100
+    # Competition ranking: ties share the best rank
+    ranks = len(totals) - at_or_below + 1
+
+    ranked = []
+    for row, response in enumerate(responses):
+        response_scores = response.get("scores") or {}
+        ranked.append({
+            "response_id": str(response["_id"]),
+            "supplier_id": str(response["supplier_id"]),
+            "status": response["status"],
+            "scores": {name: response_scores[name] for name in names if name in response_scores},
+            "total": round(float(totals[row]), 2),
+            "percentile": round(float(percentiles[row]), 2),
+            "rank": int(ranks[row])
+        })
+    ranked.sort(key=lambda response: response["rank"])
+    return ranked
+
+
+class RankingCache:
+    """Small LRU cache of rankings keyed by RFP id and ranking revision."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, rfp_id, revision: int):
+        if not get_settings().ranking_cache_enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(rfp_id)
+            if entry is None or entry[0] != revision:
+                return None
+            self._entries.move_to_end(rfp_id)
+            return entry[1]
+
+    def set(self, rfp_id, revision: int, ranking: List[dict]):
+        settings = get_settings()
+        if not settings.ranking_cache_enabled:
+            return
+        with self._lock:
+            self._entries[rfp_id] = (revision, ranking)
+            self._entries.move_to_end(rfp_id)
+            while len(self._entries) > settings.ranking_cache_size:
+                self._entries.popitem(last=False)
+
+
+ranking_cache = RankingCache()
@@ -0,0 +1,30 @@
+# FILE: backend/app/services/summary_service.py
+# ---------------------------------------------
+# This service builds the "summary" view of list endpoints.
+# Long text fields are cut to a snippet of about `summary_snippet_length`
+# characters, and their full length is sent alongside, so a list can be shown
+# without downloading every description in full.
+
+from typing import Literal
+from ..core.config import get_settings
+
+ListView = Literal["full", "summary"]
+
+
+def snippet(text: str, length: int) -> str:
+    """Cuts text to at most `length` characters, preferably at a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1]
+    boundary = cut.rfind(" ")
+    if boundary > length // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
+
+
+def summarize(document: dict, field: str) -> dict:
+    """Replaces `document[field]` with a snippet and stores its full length in `<field>_length`."""
+    text = document.get(field) or ""
+    document[f"{field}_length"] = len(text)
+    document[field] = snippet(text, get_settings().summary_snippet_length)
+    return document
@@ -0,0 +1,191 @@
+# FILE: backend/app/services/version_service.py
+# ---------------------------------------------
+# This service keeps the revision history of RFPs.
+# Every version stores the title in full, but the description only as a
+# compact word-level delta against the previous version. A full snapshot is
+# written every `version_snapshot_interval` versions, so rebuilding any
+# version never needs more than that many documents.
+
+import difflib
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import List, Optional
+from pymongo import ReturnDocument
+from ..db.database import rfp_collection, rfp_version_collection
+from ..core.config import get_settings
+
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into word tokens that concatenate back to the original."""
+    return _TOKEN_RE.findall(text)
+
+
+def make_delta(old: str, new: str) -> list:
+    """
+    Returns the changes turning `old` into `new` as a list of
+    [start, end, replacement_tokens] entries over the tokens of `old`.
+    """
+    old_tokens = tokenize(old)
+    new_tokens = tokenize(new)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    return [
+        [i1, i2, new_tokens[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_delta(base: str, delta: list) -> str:
+    """Applies a delta produced by make_delta to the text it was made from."""
+    tokens = tokenize(base)
+    result = []
+    position = 0
+    for start, end, replacement in delta:
+        result.extend(tokens[position:start])
+        result.extend(replacement)
+        position = end
+    result.extend(tokens[position:])
+    return "".join(result)
+
+
+def hash_file(file) -> str:
+    """Returns the SHA-256 of a file object's content and rewinds it."""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(64 * 1024), b""):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def is_snapshot_version(version: int) -> bool:
+    return (version - 1) % get_settings().version_snapshot_interval == 0
+
+
+def find_document_by_hash(rfp_id, document_hash: str) -> Optional[str]:
+    """Returns the URL of an attachment with this content already stored for the RFP."""
+    existing = rfp_version_collection.find_one(
+        {"rfp_id": rfp_id, "document_hash": document_hash},
+        {"document_url": 1}
+    )
+    return existing["document_url"] if existing else None
+
+
+def _version_document(rfp: dict, version: int, previous: Optional[dict],
+                      document_hash: Optional[str], created_by) -> dict:
+    version_data = {
+        "rfp_id": rfp["_id"],
+        "version": version,
+        "title": rfp["title"],
+        "document_url": rfp.get("document_url"),
+        "document_hash": document_hash,
+        "created_by": created_by,
+        "created_at": datetime.now(timezone.utc)
+    }
+    if previous is None or is_snapshot_version(version):
+        version_data["is_snapshot"] = True
+        version_data["description"] = rfp["description"]
+    else:
+        version_data["is_snapshot"] = False
+        version_data["delta"] = make_delta(previous["description"], rfp["description"])
+    return version_data
+
+
+def record_version(rfp: dict, document_hash: Optional[str] = None, created_by=None) -> int:
+    """Stores the current state of a new RFP as its next version, written as a snapshot."""
+    counter = rfp_collection.find_one_and_update(
+        {"_id": rfp["_id"]},
+        {"$inc": {"version": 1}},
+        projection={"version": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    version = counter["version"]
+    rfp_version_collection.insert_one(_version_document(rfp, version, None, document_hash, created_by))
+    return version
+
+
+def update_rfp(rfp: dict, changes: dict, document_hash: Optional[str] = None, created_by=None) -> Optional[dict]:
+    """
+    Applies `changes` to the RFP and records the result as its next version.
+    `rfp` is the RFP as the caller read it. The update only applies if no other
+    update was recorded since, so every delta is made against the version just
+    before it. Returns the updated RFP, or None on such a conflict.
+    """
+    updated = rfp_collection.find_one_and_update(
+        {"_id": rfp["_id"], "version": rfp["version"]},
+        {"$set": changes, "$inc": {"version": 1}},
+        return_document=ReturnDocument.AFTER
+    )
+    if updated is None:
+        return None
+    rfp_version_collection.insert_one(
+        _version_document(updated, updated["version"], rfp, document_hash, created_by)
+    )
+    return updated
+
+
+def ensure_baseline(rfp: dict) -> None:
+    """
+    Records RFPs created before version history existed as their first
+    version, and sets that version number on `rfp`.
+    """
+    if not rfp.get("version"):
+        rfp["version"] = record_version(rfp, created_by=rfp.get("buyer_id"))
+
+
+def list_versions(rfp_id, skip: int = 0, limit: int = 20) -> List[dict]:
+    cursor = rfp_version_collection.find(
+        {"rfp_id": rfp_id},
+        {"description": 0, "delta": 0}
+    ).sort("version", -1).skip(skip).limit(limit)
+    return list(cursor)
+
+
+def get_version(rfp_id, version: int) -> Optional[dict]:
+    """
+    Rebuilds a full version by replaying the deltas recorded since the
+    nearest snapshot at or before it.
+    """
+    # Look the snapshot up rather than computing it from the interval, so
+    # changing the interval setting does not break existing histories.
+    snapshot = rfp_version_collection.find_one(
+        {"rfp_id": rfp_id, "is_snapshot": True, "version": {"$lte": version}},
+        {"version": 1},
+        sort=[("version", -1)]
+    )
+    if snapshot is None:
+        return None
+
+    chain = list(rfp_version_collection.find(
+        {"rfp_id": rfp_id, "version": {"$gte": snapshot["version"], "$lte": version}}
+    ).sort("version", 1))
+
+    if not chain or chain[-1]["version"] != version:
+        return None
+
+    description = chain[0]["description"]
+    for entry in chain[1:]:
+        description = apply_delta(description, entry["delta"])
+
+    result = chain[-1]
+    result.pop("delta", None)
+    result["description"] = description
+    return result
+
+
+def empty_version() -> dict:
+    """The state before version 1, to diff the first version against."""
+    return {"version": 0, "title": "", "description": "", "document_url": None}
+
+
+def diff_lines(old: dict, new: dict) -> List[str]:
+    """Returns a unified diff between the descriptions of two versions."""
+    return list(difflib.unified_diff(
+        old["description"].splitlines(),
+        new["description"].splitlines(),
+        fromfile=f"v{old['version']}",
+        tofile=f"v{new['version']}",
+        lineterm=""
+    ))
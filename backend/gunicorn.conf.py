@@ -0,0 +1,28 @@
+# FILE: backend/gunicorn.conf.py
+# ------------------------------
+# Production server profile: gunicorn manages several uvicorn worker processes.
+# Run with: gunicorn -c gunicorn.conf.py app.main:app
+
+import os
+from app.core.config import get_settings
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# WEB_CONCURRENCY is the conventional variable set by most PaaS providers
+workers = get_settings().web_concurrency
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Import the app once in the master and fork the workers from it, so workers
+# start quickly and share the imported code. This is safe because the MongoDB
+# client is only created on first use inside each worker.
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = 200
+
+accesslog = "-"
@@ -0,0 +1,35 @@
+# FILE: backend/tests/conftest.py
+# -------------------------------
+# Shared fixtures: test settings, and the app running against an in-memory
+# MongoDB (mongomock) that is emptied for every test.
+
+import mongomock
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import Settings, get_settings, override_settings
+from app.db import database
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """A fresh in-memory database behind every collection of the app."""
+    override_settings(Settings(mongo_cluster_url="mongodb://localhost", jwt_secret_key="test"))
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(database, "get_client", lambda: client)
+    yield client[get_settings().database_name]
+    override_settings(None)
+
+
+@pytest.fixture
+def api(mongo):
+    """A test client for the app. Its per-process caches are reset for each test."""
+    # Imported here because building the app reads the settings
+    from app.main import app
+    from app.core.revocation import revocation_list
+    from app.services.matching_service import matching_index
+    from app.services.scoring_service import ranking_cache
+
+    revocation_list._synced_at = None
+    matching_index._loaded_at = None
+    ranking_cache._entries.clear()
+    return TestClient(app)
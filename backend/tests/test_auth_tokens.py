@@ -0,0 +1,147 @@
+# FILE: backend/tests/test_auth_tokens.py
+# ---------------------------------------
+# Checks token revocation: the bloom filter, the revocation list, refresh
+# token rotation and logout.
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from app.core.revocation import BloomFilter, RevocationList
+from app.core.security import create_access_token, user_claims
+
+PASSWORD = "secret1"
+
+
+def register(api, name: str = "buyer", role: str = "Buyer") -> dict:
+    api.post("/api/auth/register", json={
+        "username": name, "email": f"{name}@example.com", "password": PASSWORD, "role": role
+    })
+    return login(api, name)
+
+
+def login(api, name: str = "buyer") -> dict:
+    response = api.post("/api/auth/login", data={"username": f"{name}@example.com", "password": PASSWORD})
+    assert response.status_code == 200
+    return response.json()
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def claims(user_id: str, issued_at: float) -> dict:
+    return {"sub": user_id, "jti": uuid4().hex, "iat": issued_at}
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [uuid4().hex for _ in range(1000)]
+    for key in added:
+        bloom.add(key)
+    assert all(key in bloom for key in added)
+
+    rng = random.Random(7)
+    others = [f"{rng.getrandbits(128):032x}" for _ in range(10_000)]
+    false_positives = sum(key in bloom for key in others)
+    assert false_positives < 300
+
+
+def test_revoke_token_succeeds_once(mongo):
+    revocations = RevocationList()
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert revocations.revoke_token("abc", expires_at) is True
+    assert revocations.revoke_token("abc", expires_at) is False
+
+    assert revocations.is_revoked({"sub": "1", "jti": "abc", "iat": time.time()})
+    assert not revocations.is_revoked({"sub": "1", "jti": "other", "iat": time.time()})
+
+
+def test_revoke_user_spares_tokens_issued_afterwards(mongo):
+    revocations = RevocationList()
+    before = claims("user", time.time())
+    revocations.revoke_user("user")
+    # Issued in the same second as the revocation, but after it
+    after = claims("user", time.time() + 0.001)
+
+    assert revocations.is_revoked(before)
+    assert not revocations.is_revoked(after)
+    assert revocations.is_user_revoked(before)
+    assert not revocations.is_user_revoked(after)
+    assert not revocations.is_revoked(claims("someone else", before["iat"]))
+
+
+def test_revocations_reach_other_workers_through_the_database(mongo):
+    revoking_worker, other_worker = RevocationList(), RevocationList()
+    token = claims("user", time.time())
+    other_worker.is_revoked(token)  # synced before the revocation
+
+    revoking_worker.revoke_token(token["jti"], datetime.now(timezone.utc) + timedelta(hours=1))
+    # The other worker's filter is stale until its next sync, but refreshes check the database
+    assert not other_worker.revoke_token(token["jti"], datetime.now(timezone.utc) + timedelta(hours=1))
+
+
+def test_refresh_rotates_and_rejects_reuse(api):
+    tokens = register(api)
+    refreshed = api.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["refresh_token"] != tokens["refresh_token"]
+
+    reused = api.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert reused.status_code == 401
+    # An access token is not a refresh token
+    as_refresh = api.post("/api/auth/refresh", json={"refresh_token": tokens["access_token"]})
+    assert as_refresh.status_code == 401
+
+
+def test_access_token_is_rejected_after_logout(api):
+    tokens = register(api)
+    assert api.get("/api/auth/me", headers=bearer(tokens["access_token"])).status_code == 200
+
+    logout = api.post("/api/auth/logout", json={"refresh_token": tokens["refresh_token"]},
+                      headers=bearer(tokens["access_token"]))
+    assert logout.status_code == 204
+    assert api.get("/api/auth/me", headers=bearer(tokens["access_token"])).status_code == 401
+    assert api.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+def test_logout_with_an_expired_access_token_revokes_the_refresh_token(api, mongo):
+    tokens = register(api)
+    user = mongo.users.find_one({"email": "buyer@example.com"})
+    expired = create_access_token(user_claims(user), expires_delta=timedelta(seconds=-10))
+
+    logout = api.post("/api/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=bearer(expired))
+    assert logout.status_code == 204
+    assert api.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+@pytest.mark.parametrize("body, headers", [
+    (None, {}),
+    ({"refresh_token": "not-a-token"}, {}),
+])
+def test_logout_needs_a_valid_token(api, body, headers):
+    register(api)
+    assert api.post("/api/auth/logout", json=body, headers=headers).status_code == 401
+
+
+def test_logout_rejects_tokens_of_different_users(api):
+    buyer = register(api, "buyer")
+    supplier = register(api, "supplier", "Supplier")
+    logout = api.post("/api/auth/logout", json={"refresh_token": supplier["refresh_token"]},
+                      headers=bearer(buyer["access_token"]))
+    assert logout.status_code == 401
+
+
+def test_logout_of_all_sessions_keeps_later_logins(api):
+    first = register(api)
+    second = login(api)
+
+    logout = api.post("/api/auth/logout", json={"all_sessions": True}, headers=bearer(first["access_token"]))
+    assert logout.status_code == 204
+    assert api.get("/api/auth/me", headers=bearer(second["access_token"])).status_code == 401
+    assert api.post("/api/auth/refresh", json={"refresh_token": second["refresh_token"]}).status_code == 401
+
+    # A token issued right after the revocation is still accepted
+    again = login(api)
+    assert api.get("/api/auth/me", headers=bearer(again["access_token"])).status_code == 200
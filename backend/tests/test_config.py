@@ -0,0 +1,29 @@
+# FILE: backend/tests/test_config.py
+# ----------------------------------
+# Checks how settings are read from the environment.
+
+import pytest
+from app.core.config import load_settings
+
+
+@pytest.fixture
+def environment(monkeypatch):
+    monkeypatch.setenv("MONGO_CLUSTER_URL", "mongodb://localhost")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test")
+    return monkeypatch
+
+
+def test_logger_mappings_are_parsed(environment):
+    environment.setenv("LOG_SAMPLE_RATES", "app.apis.rfps=0.5, app.core.etag = 0.1,")
+    environment.setenv("LOG_RATE_LIMITS", "app.services.email_service=5")
+    settings = load_settings()
+    assert settings.log_sample_rates == {"app.apis.rfps": 0.5, "app.core.etag": 0.1}
+    assert settings.log_rate_limits == {"app.services.email_service": 5.0}
+
+
+@pytest.mark.parametrize("variable", ["LOG_SAMPLE_RATES", "LOG_RATE_LIMITS"])
+@pytest.mark.parametrize("value", ["foo", "app.apis.rfps=0.5,foo", "=2", "app.apis.rfps="])
+def test_malformed_logger_mappings_name_the_variable(environment, variable, value):
+    environment.setenv(variable, value)
+    with pytest.raises(ValueError, match=f"^{variable} entries"):
+        load_settings()
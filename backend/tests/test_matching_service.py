@@ -0,0 +1,74 @@
+# FILE: backend/tests/test_matching_service.py
+# --------------------------------------------
+# Checks the sparse TF-IDF index that recommends RFPs to suppliers.
+
+import mongomock
+import pytest
+from app.core.config import Settings, override_settings
+from app.services import matching_service
+from app.services.matching_service import MatchingIndex, _Postings
+
+RFPS = [
+    {"_id": 1, "title": "Cloud hosting migration", "description": "Move our servers to a cloud hosting provider"},
+    {"_id": 2, "title": "Office catering services", "description": "Daily food and catering for staff"},
+    {"_id": 3, "title": "Security audit", "description": "Penetration testing of our cloud web apps"},
+]
+
+
+@pytest.fixture
+def rfps(monkeypatch):
+    override_settings(Settings(mongo_cluster_url="mongodb://localhost", jwt_secret_key="test",
+                               matching_index_refresh_seconds=3600))
+    collection = mongomock.MongoClient().db.rfps
+    collection.insert_many([{**rfp, "status": "Published"} for rfp in RFPS])
+    monkeypatch.setattr(matching_service, "rfp_collection", collection)
+    yield collection
+    override_settings(None)
+
+
+def test_incremental_updates_match_a_fresh_build():
+    incremental = _Postings()
+    for rfp in RFPS:
+        incremental.add(str(rfp["_id"]), matching_service.rfp_terms(rfp))
+    incremental.remove("2")
+    incremental.add("2", matching_service.rfp_terms(RFPS[1]))
+    built = _Postings.build(RFPS)
+
+    query = built.query_weights(["cloud", "hosting"])
+    assert incremental.query_weights(["cloud", "hosting"]) == query
+    fresh, updated = built.scores(query), incremental.scores(query)
+    assert sorted(fresh, key=fresh.get) == sorted(updated, key=updated.get)
+    assert all(0 < score <= 1 for score in updated.values())
+    # Only RFPs sharing a term with the query are scored
+    assert "2" not in updated
+
+
+def test_recommend_and_match_suppliers(rfps):
+    index = MatchingIndex()
+    recommended = index.recommend(["cloud hosting"], limit=2)
+    assert [rfp_id for rfp_id, _ in recommended] == ["1", "3"]
+
+    suppliers = [
+        {"email": "cloud@x.com", "capabilities": ["cloud hosting"]},
+        {"email": "food@x.com", "capabilities": ["catering"]},
+        {"email": "new@x.com"},
+    ]
+    matched = index.match_suppliers(RFPS[1], suppliers)
+    assert [supplier["email"] for supplier in matched] == ["new@x.com", "food@x.com"]
+
+    index.remove_rfp(1)
+    assert [rfp_id for rfp_id, _ in index.recommend(["cloud hosting"])] == ["3"]
+
+
+def test_rebuild_replays_changes_made_while_it_runs(rfps):
+    index = MatchingIndex()
+    index.recommend(["cloud"])
+
+    # A rebuild has read the database, then an RFP is published and another closed
+    index._pending = []
+    index.add_rfp({"_id": 4, "title": "Cloud backup", "description": "Nightly cloud backups"})
+    index.remove_rfp(3)
+    index._rebuild()
+
+    assert index._pending is None
+    assert [rfp_id for rfp_id, _ in index.recommend(["cloud backup"])] == ["4", "1"]
@@ -0,0 +1,168 @@
+# FILE: backend/tests/test_scoring_service.py
+# -------------------------------------------
+# Checks the weighted ranking of responses and the invalidation of cached rankings.
+
+from types import SimpleNamespace
+import mongomock
+import pytest
+from bson import ObjectId
+from app.core.config import Settings, override_settings
+from app.services.scoring_service import RankingCache, rank_responses
+
+CRITERIA = [
+    {"name": "price", "weight": 2, "max_score": 10},
+    {"name": "quality", "weight": 1, "max_score": 5},
+]
+
+
+def response(number: int, scores: dict = None) -> dict:
+    return {"_id": number, "supplier_id": f"supplier{number}", "status": "Submitted", "scores": scores}
+
+
+def by_id(ranking: list) -> dict:
+    return {entry["response_id"]: entry for entry in ranking}
+
+
+def test_rank_responses_normalizes_weights_and_scores():
+    ranking = by_id(rank_responses(CRITERIA, [
+        response(1, {"price": 10, "quality": 5}),
+        response(2, {"price": 5, "quality": 5}),
+        response(3, {"quality": 2.5}),
+        response(4),
+    ]))
+    # Weights 2:1 become 2/3 and 1/3 of a total out of 100
+    assert ranking["1"]["total"] == 100
+    assert ranking["2"]["total"] == pytest.approx(66.67)
+    assert ranking["3"]["total"] == pytest.approx(16.67)
+    # Missing scores count as 0 and are not reported
+    assert ranking["4"]["total"] == 0
+    assert ranking["4"]["scores"] == {}
+    assert [ranking[key]["rank"] for key in "1234"] == [1, 2, 3, 4]
+
+
+def test_rank_responses_clips_scores_to_the_criterion_range():
+    ranking = by_id(rank_responses(CRITERIA, [
+        response(1, {"price": 25, "quality": 5}),
+        response(2, {"price": -3, "quality": 5}),
+    ]))
+    assert ranking["1"]["total"] == 100
+    assert ranking["2"]["total"] == pytest.approx(33.33)
+    # Scores are reported as stored
+    assert ranking["1"]["scores"] == {"price": 25, "quality": 5}
+
+
+def test_tied_totals_share_the_best_rank_and_percentile():
+    ranking = rank_responses(CRITERIA, [
+        response(1, {"price": 5}),
+        response(2, {"price": 10}),
+        response(3, {"price": 5}),
+        response(4, {"price": 1}),
+    ])
+    assert ranking[0]["response_id"] == "2"
+    ranks = {entry["response_id"]: entry["rank"] for entry in ranking}
+    assert ranks == {"2": 1, "1": 2, "3": 2, "4": 4}
+    # Percentile: share of responses with the same or a lower total
+    percentiles = {entry["response_id"]: entry["percentile"] for entry in ranking}
+    assert percentiles == {"2": 100, "1": 75, "3": 75, "4": 25}
+
+
+def test_rank_responses_without_responses():
+    assert rank_responses(CRITERIA, []) == []
+
+
+@pytest.fixture
+def ranking_settings():
+    def use(**values):
+        override_settings(Settings(mongo_cluster_url="mongodb://localhost", jwt_secret_key="test", **values))
+    yield use
+    override_settings(None)
+
+
+def test_ranking_cache_is_keyed_by_revision(ranking_settings):
+    ranking_settings(ranking_cache_size=2)
+    cache = RankingCache()
+    cache.set("a", 1, ["a1"])
+    assert cache.get("a", 1) == ["a1"]
+    assert cache.get("a", 2) is None
+    assert cache.get("b", 1) is None
+
+    # The least recently used RFP is evicted first
+    cache.set("b", 1, ["b1"])
+    cache.get("a", 1)
+    cache.set("c", 1, ["c1"])
+    assert cache.get("a", 1) == ["a1"]
+    assert cache.get("b", 1) is None
+    assert cache.get("c", 1) == ["c1"]
+
+
+def test_ranking_cache_can_be_disabled(ranking_settings):
+    ranking_settings(ranking_cache_enabled=False)
+    cache = RankingCache()
+    cache.set("a", 1, ["a1"])
+    assert cache.get("a", 1) is None
+
+
+def bulk_write(self, operations, ordered=True):
+    # mongomock 4.3 cannot run the UpdateOne operations of recent pymongo versions
+    matched = sum(self.update_one(operation._filter, operation._doc).matched_count for operation in operations)
+    return SimpleNamespace(matched_count=matched)
+
+
+@pytest.fixture
+def evaluation(api, mongo, monkeypatch):
+    """An RFP with criteria and three responses, and the headers of its Buyer."""
+    monkeypatch.setattr(mongomock.collection.Collection, "bulk_write", bulk_write)
+    api.post("/api/auth/register", json={
+        "username": "buyer", "email": "buyer@example.com", "password": "secret1", "role": "Buyer"
+    })
+    tokens = api.post("/api/auth/login", data={"username": "buyer@example.com", "password": "secret1"}).json()
+    buyer = mongo.users.find_one({"email": "buyer@example.com"})
+    rfp_id = mongo.rfps.insert_one({
+        "title": "Cloud hosting", "description": "Hosting", "buyer_id": buyer["_id"], "status": "Under Review"
+    }).inserted_id
+    response_ids = [
+        str(mongo.responses.insert_one({"rfp_id": rfp_id, "supplier_id": ObjectId(), "status": "Submitted"}).inserted_id)
+        for _ in range(3)
+    ]
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert api.put(f"/api/rfps/{rfp_id}/criteria", json={"criteria": CRITERIA}, headers=headers).status_code == 200
+    return SimpleNamespace(rfp_id=str(rfp_id), response_ids=response_ids, headers=headers)
+
+
+def totals(api, evaluation) -> dict:
+    ranking = api.get(f"/api/rfps/{evaluation.rfp_id}/ranking", headers=evaluation.headers).json()
+    return {entry["response_id"]: entry["total"] for entry in ranking["responses"]}
+
+
+def test_ranking_is_cached_until_the_revision_changes(api, mongo, evaluation):
+    first, second, third = evaluation.response_ids
+    assert set(totals(api, evaluation).values()) == {0}
+
+    # A write that does not bump the revision is not seen: the cached ranking is served
+    mongo.responses.update_one({"_id": ObjectId(first)}, {"$set": {"scores.price": 10}})
+    assert totals(api, evaluation)[first] == 0
+
+    scored = api.put(f"/api/rfps/{evaluation.rfp_id}/responses/{second}/scores",
+                     json={"scores": {"quality": 5}}, headers=evaluation.headers)
+    assert scored.json() == {"updated": 1}
+    assert totals(api, evaluation) == {first: pytest.approx(66.67), second: pytest.approx(33.33), third: 0}
+
+
+def test_bulk_scores_invalidate_the_ranking(api, evaluation):
+    first, second, third = evaluation.response_ids
+    totals(api, evaluation)
+
+    uploaded = api.post(f"/api/rfps/{evaluation.rfp_id}/scores/bulk", json={"items": [
+        {"response_id": first, "scores": {"price": 5, "quality": 5}},
+        {"response_id": third, "scores": {"price": 10}},
+    ]}, headers=evaluation.headers)
+    assert uploaded.json() == {"updated": 2}
+    assert totals(api, evaluation) == {first: pytest.approx(66.67), third: pytest.approx(66.67), second: 0}
+
+    # Nothing is written when one item is invalid
+    rejected = api.post(f"/api/rfps/{evaluation.rfp_id}/scores/bulk", json={"items": [
+        {"response_id": second, "scores": {"price": 10}},
+        {"response_id": first, "scores": {"quality": 6}},
+    ]}, headers=evaluation.headers)
+    assert rejected.status_code == 400
+    assert totals(api, evaluation)[second] == 0
@@ -0,0 +1,92 @@
+# FILE: backend/tests/test_version_service.py
+# -------------------------------------------
+# Checks that RFP versions are rebuilt exactly from their snapshots and deltas.
+
+import random
+import mongomock
+import pytest
+from app.core.config import Settings, override_settings
+from app.services import version_service
+
+WORDS = ["cloud", "hosting", "backup", "SLA", "99.9%", "uptime,", "support.", "24/7", "é", ""]
+SEPARATORS = [" ", "  ", "\n", "\n\n", "\t", " \n"]
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(WORDS) + rng.choice(SEPARATORS) for _ in range(length))
+
+
+def random_edit(rng: random.Random, text: str) -> str:
+    """Inserts, deletes or replaces a random span, sometimes at the edges or with odd whitespace."""
+    start = rng.randint(0, len(text))
+    end = rng.randint(start, min(len(text), start + 40))
+    replacement = random_text(rng, rng.randint(0, 5))
+    if rng.random() < 0.2:
+        replacement = replacement.strip() or " "
+    return text[:start] + replacement + text[end:]
+
+
+def test_delta_round_trip():
+    rng = random.Random(1234)
+    for _ in range(50):
+        text = random_text(rng, rng.randint(0, 30))
+        for _ in range(20):
+            new_text = random_edit(rng, text)
+            assert version_service.apply_delta(text, version_service.make_delta(text, new_text)) == new_text
+            text = new_text
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    database = mongomock.MongoClient().db
+    monkeypatch.setattr(version_service, "rfp_collection", database.rfps)
+    monkeypatch.setattr(version_service, "rfp_version_collection", database.rfp_versions)
+    yield database
+    override_settings(None)
+
+
+def use_snapshot_interval(interval: int):
+    override_settings(Settings(mongo_cluster_url="mongodb://localhost", jwt_secret_key="test",
+                               version_snapshot_interval=interval))
+
+
+def test_versions_rebuild_across_snapshot_intervals(collections):
+    rng = random.Random(99)
+    use_snapshot_interval(3)
+    rfp = {"_id": 1, "title": "Cloud hosting", "description": random_text(rng, 40)}
+    collections.rfps.insert_one(dict(rfp))
+    descriptions = {version_service.record_version(rfp): rfp["description"]}
+    rfp = collections.rfps.find_one({"_id": 1})
+
+    for step in range(25):
+        if step == 12:
+            # Existing histories must survive a change of the interval
+            use_snapshot_interval(5)
+        rfp = version_service.update_rfp(rfp, {"description": random_edit(rng, rfp["description"])})
+        descriptions[rfp["version"]] = rfp["description"]
+
+    assert collections.rfp_versions.count_documents({"is_snapshot": True}) > 2
+    for version, description in descriptions.items():
+        assert version_service.get_version(1, version)["description"] == description
+    assert version_service.get_version(1, len(descriptions) + 1) is None
+
+
+def test_overlapping_updates_keep_history_consistent(collections):
+    use_snapshot_interval(10)
+    collections.rfps.insert_one({"_id": 1, "title": "Hosting", "description": "alpha beta gamma"})
+    version_service.record_version(collections.rfps.find_one({"_id": 1}))
+
+    # Both updates read version 1 before either of them is applied
+    first_read = collections.rfps.find_one({"_id": 1})
+    second_read = collections.rfps.find_one({"_id": 1})
+    assert version_service.update_rfp(first_read, {"description": "alpha beta gamma delta"}) is not None
+    assert version_service.update_rfp(second_read, {"description": "zeta beta gamma"}) is None
+
+    stored = collections.rfps.find_one({"_id": 1})
+    assert stored["version"] == 2
+    assert version_service.get_version(1, 2)["description"] == stored["description"] == "alpha beta gamma delta"
+    assert version_service.get_version(1, 3) is None
+
+    # Retrying from the latest version builds on it
+    retried = version_service.update_rfp(stored, {"description": "zeta beta gamma delta"})
+    assert version_service.get_version(1, 3)["description"] == retried["description"] == "zeta beta gamma delta"
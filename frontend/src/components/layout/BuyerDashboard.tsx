@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { Link } from 'react-router-dom';
 import { getRFPs, deleteRFP, updateRFPStatus } from '../../services/rfpService';
 import CreateRFPModal from '../modals/CreateRFPModal';
@@ -17,22 +17,30 @@ const BuyerDashboard: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
+  // Aborted when a new fetch starts or the dashboard unmounts, so late background updates are dropped
+  const listUpdates = useRef<AbortController | null>(null);
+  const cancelListUpdates = useCallback(() => listUpdates.current?.abort(), []);
 
   const fetchRfps = useCallback(async () => {
+    cancelListUpdates();
+    const controller = new AbortController();
+    listUpdates.current = controller;
     try {
       setLoading(true);
-      const response = await getRFPs();
+      const response = await getRFPs(setRfps, controller.signal);
+      if (controller.signal.aborted) return;
       setRfps(response.data);
     } catch (err) {
-      setError('Failed to fetch RFPs.');
+      if (!controller.signal.aborted) setError('Failed to fetch RFPs.');
     } finally {
-      setLoading(false);
+      if (!controller.signal.aborted) setLoading(false);
     }
-  }, []);
+  }, [cancelListUpdates]);
 
   useEffect(() => {
     fetchRfps();
-  }, [fetchRfps]);
+    return cancelListUpdates;
+  }, [fetchRfps, cancelListUpdates]);
 
   const handleRfpCreated = () => {
     setIsModalOpen(false);
@@ -3,7 +3,7 @@
 // This component displays the dashboard for a Supplier user.
 // It fetches all published RFPs from the backend API.
 
-import React, { useState, useEffect, useCallback, useMemo } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { Link } from 'react-router-dom';
 import { getRFPs, getMySubmissions, searchRFPs } from '../../services/rfpService';
 import { SupplierSkeleton } from '../common/SkeletonLoader'; // Import the skeleton loader
@@ -32,26 +32,35 @@ const SupplierDashboard: React.FC = () => {
   
   const [searchQuery, setSearchQuery] = useState('');
   const [isSearching, setIsSearching] = useState(false);
+  // Aborted when a search replaces the list, a new fetch starts or the dashboard unmounts,
+  // so late background updates of the lists are dropped
+  const listUpdates = useRef<AbortController | null>(null);
+  const cancelListUpdates = useCallback(() => listUpdates.current?.abort(), []);
 
   const fetchInitialData = useCallback(async () => {
+    cancelListUpdates();
+    const controller = new AbortController();
+    listUpdates.current = controller;
     try {
       setLoading(true);
       const [rfpResponse, submissionResponse] = await Promise.all([
-        getRFPs(),
-        getMySubmissions(),
+        getRFPs(setRfps, controller.signal),
+        getMySubmissions(setSubmissions, controller.signal),
       ]);
+      if (controller.signal.aborted) return;
       setRfps(rfpResponse.data);
       setSubmissions(submissionResponse.data);
     } catch (err) {
-      setError('Failed to fetch dashboard data.');
+      if (!controller.signal.aborted) setError('Failed to fetch dashboard data.');
     } finally {
-      setLoading(false);
+      if (!controller.signal.aborted) setLoading(false);
     }
-  }, []);
+  }, [cancelListUpdates]);
 
   useEffect(() => {
     fetchInitialData();
-  }, [fetchInitialData]);
+    return cancelListUpdates;
+  }, [fetchInitialData, cancelListUpdates]);
 
   const availableRfps = useMemo(() => {
     const submittedRfpIds = new Set(submissions.map(sub => sub.rfp_id));
@@ -65,6 +74,7 @@ const SupplierDashboard: React.FC = () => {
       return;
     }
     
+    cancelListUpdates();
     try {
       setIsSearching(true);
       setError(null);
@@ -2,8 +2,10 @@
 // ------------------------------------------
 // Manages global authentication state (token, user info).
 
-import React, { createContext, useState, useContext, ReactNode, useEffect } from 'react';
-import { login as loginService } from '../services/authService';
+import React, { createContext, useState, useContext, ReactNode, useEffect, useCallback } from 'react';
+import { login as loginService, logout as logoutService } from '../services/authService';
+import { setSessionExpiredHandler } from '../services/api';
+import { clearQueryCache } from '../services/queryCache';
 import { jwtDecode } from 'jwt-decode';
 
 // Define the new shape of our context, including the `loading` state
@@ -44,16 +46,38 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
 
   const login = async (email: string, password: string) => {
     const response = await loginService(email, password);
-    const { access_token } = response.data;
+    const { access_token, refresh_token } = response.data;
     localStorage.setItem('token', access_token);
+    localStorage.setItem('refreshToken', refresh_token);
+    // Cached data belongs to the previous user
+    clearQueryCache();
     setToken(access_token);
     setUser(jwtDecode(access_token));
   };
 
-  const logout = () => {
+  // The single place where a session ends locally, whether the user logged
+  // out or the API could not refresh the tokens any more
+  const endSession = useCallback(() => {
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
+    clearQueryCache();
     setToken(null);
     setUser(null);
+  }, []);
+
+  useEffect(() => {
+    setSessionExpiredHandler(endSession);
+    return () => setSessionExpiredHandler(null);
+  }, [endSession]);
+
+  const logout = () => {
+    // Revoke the tokens on the server; the local session ends either way
+    const storedToken = localStorage.getItem('token');
+    const storedRefreshToken = localStorage.getItem('refreshToken');
+    if (storedToken || storedRefreshToken) {
+      logoutService(storedToken, storedRefreshToken).catch(() => {});
+    }
+    endSession();
   };
 
   return (
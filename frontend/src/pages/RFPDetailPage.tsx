@@ -2,7 +2,7 @@
 // ------------------------------------------
 // This page displays the details of a single RFP and its responses.
 
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { getRFPById, getResponsesForRFP, updateResponseStatus, submitResponse, updateRFPStatus } from '../services/rfpService';
 import Layout from '../components/layout/Layout';
@@ -43,29 +43,39 @@ const RFPDetailPage: React.FC = () => {
   const [isSubmitting, setIsSubmitting] = useState(false); // NEW loading state
   const [submitError, setSubmitError] = useState<string | null>(null);
   const [submitSuccess, setSubmitSuccess] = useState<string | null>(null);
+  // Aborted when a new fetch starts, another RFP is opened or the page unmounts,
+  // so late background updates never show data of the wrong RFP
+  const dataUpdates = useRef<AbortController | null>(null);
+  const cancelDataUpdates = useCallback(() => dataUpdates.current?.abort(), []);
 
 
   const fetchData = useCallback(async () => {
     if (!rfpId) return;
+    cancelDataUpdates();
+    const controller = new AbortController();
+    dataUpdates.current = controller;
     try {
       setLoading(true);
-      const rfpResponse = await getRFPById(rfpId);
+      const rfpResponse = await getRFPById(rfpId, setRfp, controller.signal);
+      if (controller.signal.aborted) return;
       setRfp(rfpResponse.data);
       // Only fetch responses if the user is a Buyer
       if (user?.role === 'Buyer') {
-        const responsesResponse = await getResponsesForRFP(rfpId);
+        const responsesResponse = await getResponsesForRFP(rfpId, setResponses, controller.signal);
+        if (controller.signal.aborted) return;
         setResponses(responsesResponse.data);
       }
     } catch (err) {
-      setError('Failed to load RFP details.');
+      if (!controller.signal.aborted) setError('Failed to load RFP details.');
     } finally {
-      setLoading(false);
+      if (!controller.signal.aborted) setLoading(false);
     }
-  }, [rfpId, user?.role]);
+  }, [rfpId, user?.role, cancelDataUpdates]);
 
   useEffect(() => {
     fetchData();
-  }, [fetchData]);
+    return cancelDataUpdates;
+  }, [fetchData, cancelDataUpdates]);
 
   const handleResponseStatusUpdate = async (responseId: string, status: 'Approved' | 'Rejected') => {
     if (!rfpId) return;
@@ -2,7 +2,7 @@
 // ----------------------------------
 // This file configures our Axios instance for making API calls.
 
-import axios from 'axios';
+import axios, { InternalAxiosRequestConfig } from 'axios';
 
 // Create a new Axios instance with a base URL
 const api = axios.create({
@@ -23,6 +23,55 @@ api.interceptors.request.use(
   }
 );
 
+// Add a response interceptor that renews an expired access token with the
+// refresh token and retries the request once. Concurrent 401s share one refresh.
+// When the refresh fails the session is over, and the handler registered by
+// AuthContext ends it everywhere (stored tokens, cached data, auth state).
+let refreshPromise: Promise<string> | null = null;
+let onSessionExpired: (() => void) | null = null;
+
+export const setSessionExpiredHandler = (handler: (() => void) | null) => {
+  onSessionExpired = handler;
+};
+
+const refreshAccessToken = async (): Promise<string> => {
+  const refreshToken = localStorage.getItem('refreshToken');
+  if (!refreshToken) {
+    throw new Error('No refresh token');
+  }
+  // Use a bare axios call so this request does not go through the interceptors
+  const response = await axios.post(`${api.defaults.baseURL}/auth/refresh`, { refresh_token: refreshToken });
+  const { access_token, refresh_token } = response.data;
+  localStorage.setItem('token', access_token);
+  localStorage.setItem('refreshToken', refresh_token);
+  return access_token;
+};
+
+api.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const original = error.config as (InternalAxiosRequestConfig & { _retried?: boolean }) | undefined;
+    if (error.response?.status !== 401 || !original || original._retried || original.url?.startsWith('/auth/')) {
+      return Promise.reject(error);
+    }
+    original._retried = true;
+    try {
+      refreshPromise = refreshPromise || refreshAccessToken().finally(() => { refreshPromise = null; });
+      const token = await refreshPromise;
+      original.headers.Authorization = `Bearer ${token}`;
+      return api(original);
+    } catch (refreshError) {
+      if (onSessionExpired) {
+        onSessionExpired();
+      } else {
+        localStorage.removeItem('token');
+        localStorage.removeItem('refreshToken');
+      }
+      return Promise.reject(error);
+    }
+  }
+);
+
 // Export the default API instance for other services (like authService)
 export default api;
 
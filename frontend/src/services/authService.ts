@@ -22,4 +22,12 @@ export const login = (email: string, password: string) => {
   return api.post('/auth/login', params, {
     headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
   });
-};
\ No newline at end of file
+};
+
+// The tokens are passed explicitly because they are cleared from storage right after this call.
+// Either one is enough, and the access token may have expired.
+export const logout = (token: string | null, refreshToken: string | null) => {
+  return api.post('/auth/logout', { refresh_token: refreshToken }, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+  });
+};
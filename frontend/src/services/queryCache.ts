@@ -0,0 +1,211 @@
+// FILE: frontend/src/services/queryCache.ts
+// -----------------------------------------
+// This file contains a small cache for GET requests.
+// - Concurrent requests for the same URL share one network call.
+// - Cached data is returned at once. Data older than STALE_AFTER_MS is also
+//   refetched in the background, and `onUpdate` receives it if it changed
+//   (stale-while-revalidate), unless the caller's AbortSignal fired first.
+// - Entries are kept in IndexedDB, so a page reload starts from the last data.
+//   At most MAX_ENTRIES are kept, and persisted ones expire after MAX_AGE_MS.
+// - Refetches send the cached ETag in If-None-Match; a 304 keeps the cached data.
+// Mutations call invalidateQueries() for the URLs whose data they change.
+
+import api from './api';
+
+interface CacheEntry {
+  data: any;
+  etag: string | null;
+  fetchedAt: number;
+}
+
+const STALE_AFTER_MS = 30 * 1000;
+const MAX_ENTRIES = 200;
+const MAX_AGE_MS = 7 * 24 * 60 * 60 * 1000;
+const DB_NAME = 'rfp-query-cache';
+const STORE_NAME = 'queries';
+
+const memory = new Map<string, CacheEntry>();
+const inFlight = new Map<string, Promise<CacheEntry>>();
+// Bumped by every invalidation, so responses to requests sent before it are not cached
+let generation = 0;
+
+// --- IndexedDB persistence ---
+// Every IndexedDB failure (e.g. private browsing) falls back to the in-memory cache.
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+const openDb = (): Promise<IDBDatabase | null> => {
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null);
+        return;
+      }
+      const request = indexedDB.open(DB_NAME, 1);
+      request.onupgradeneeded = () => request.result.createObjectStore(STORE_NAME);
+      request.onsuccess = () => {
+        pruneStore(request.result);
+        resolve(request.result);
+      };
+      request.onerror = () => resolve(null);
+    });
+  }
+  return dbPromise;
+};
+
+const runStoreRequest = async <T>(
+  mode: IDBTransactionMode,
+  makeRequest: (store: IDBObjectStore) => IDBRequest<T>
+): Promise<T | undefined> => {
+  const db = await openDb();
+  if (!db) return undefined;
+  return new Promise((resolve) => {
+    try {
+      const request = makeRequest(db.transaction(STORE_NAME, mode).objectStore(STORE_NAME));
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => resolve(undefined);
+    } catch (error) {
+      resolve(undefined);
+    }
+  });
+};
+
+// Drops persisted entries older than MAX_AGE_MS, then the oldest beyond MAX_ENTRIES.
+// Runs once per page load, when the database is opened.
+const pruneStore = (db: IDBDatabase) => {
+  try {
+    const store = db.transaction(STORE_NAME, 'readwrite').objectStore(STORE_NAME);
+    const kept: { key: IDBValidKey; fetchedAt: number }[] = [];
+    const request = store.openCursor();
+    request.onsuccess = () => {
+      const cursor = request.result;
+      if (!cursor) {
+        kept
+          .sort((a, b) => b.fetchedAt - a.fetchedAt)
+          .slice(MAX_ENTRIES)
+          .forEach(({ key }) => store.delete(key));
+        return;
+      }
+      const entry = cursor.value as CacheEntry;
+      if (Date.now() - entry.fetchedAt > MAX_AGE_MS) {
+        cursor.delete();
+      } else {
+        kept.push({ key: cursor.key, fetchedAt: entry.fetchedAt });
+      }
+      cursor.continue();
+    };
+  } catch (error) {
+    // Pruning is best effort
+  }
+};
+
+// Keys are URLs, so every key starting with `prefix` falls within this range
+const prefixRange = (prefix: string) => IDBKeyRange.bound(prefix, prefix + '\uffff');
+
+// --- Cache ---
+
+const makeKey = (url: string, params?: Record<string, string>) => {
+  if (!params) return url;
+  const sorted = Object.keys(params).sort().map((name) => [name, params[name]]);
+  return `${url}?${new URLSearchParams(sorted).toString()}`;
+};
+
+// Keeps an entry in memory, dropping the least recently stored one beyond MAX_ENTRIES
+const remember = (key: string, entry: CacheEntry) => {
+  memory.delete(key);
+  memory.set(key, entry);
+  if (memory.size > MAX_ENTRIES) {
+    const oldest = memory.keys().next().value;
+    if (oldest !== undefined) memory.delete(oldest);
+  }
+};
+
+const fetchEntry = (key: string, url: string, params?: Record<string, string>, cached?: CacheEntry) => {
+  const existing = inFlight.get(key);
+  if (existing) return existing;
+
+  const startedGeneration = generation;
+  const promise = api
+    .get(url, {
+      params,
+      headers: cached?.etag ? { 'If-None-Match': cached.etag } : {},
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    })
+    .then((response) => {
+      const entry: CacheEntry = response.status === 304 && cached
+        ? { ...cached, fetchedAt: Date.now() }
+        : { data: response.data, etag: response.headers['etag'] ?? null, fetchedAt: Date.now() };
+      if (startedGeneration === generation) {
+        remember(key, entry);
+        runStoreRequest('readwrite', (store) => store.put(entry, key));
+      }
+      return entry;
+    })
+    .finally(() => {
+      if (inFlight.get(key) === promise) inFlight.delete(key);
+    });
+
+  inFlight.set(key, promise);
+  return promise;
+};
+
+/**
+ * GETs `url` through the cache. Resolves with `{ data }` like an Axios response.
+ * When cached data is returned and turns out to be stale, `onUpdate` is called
+ * with the fresh data once it arrives. Aborting `signal` cancels that call, e.g.
+ * when the component unmounts or the data it would replace is no longer shown.
+ */
+export const cachedGet = async <T = any>(
+  url: string,
+  params?: Record<string, string>,
+  onUpdate?: (data: T) => void,
+  signal?: AbortSignal
+): Promise<{ data: T }> => {
+  const key = makeKey(url, params);
+  let cached = memory.get(key);
+  if (!cached) {
+    const readGeneration = generation;
+    const persisted = await runStoreRequest<CacheEntry>('readonly', (store) => store.get(key));
+    if (persisted && readGeneration === generation && Date.now() - persisted.fetchedAt <= MAX_AGE_MS) {
+      cached = persisted;
+      remember(key, cached);
+    }
+  }
+
+  if (!cached) {
+    const entry = await fetchEntry(key, url, params);
+    return { data: entry.data };
+  }
+
+  if (Date.now() - cached.fetchedAt > STALE_AFTER_MS) {
+    const stale = cached;
+    fetchEntry(key, url, params, stale)
+      .then((entry) => {
+        if (entry.data !== stale.data && onUpdate && !signal?.aborted) onUpdate(entry.data);
+      })
+      .catch(() => {}); // Keep showing the cached data if the refetch fails
+  }
+  return { data: cached.data };
+};
+
+/** Drops every cached entry whose URL starts with one of the prefixes. */
+export const invalidateQueries = (...prefixes: string[]) => {
+  generation += 1;
+  prefixes.forEach((prefix) => {
+    Array.from(memory.keys()).forEach((key) => {
+      if (key.startsWith(prefix)) memory.delete(key);
+    });
+    Array.from(inFlight.keys()).forEach((key) => {
+      if (key.startsWith(prefix)) inFlight.delete(key);
+    });
+    runStoreRequest('readwrite', (store) => store.delete(prefixRange(prefix)));
+  });
+};
+
+/** Drops the whole cache, e.g. when the user logs in or out. */
+export const clearQueryCache = () => {
+  generation += 1;
+  memory.clear();
+  inFlight.clear();
+  runStoreRequest('readwrite', (store) => store.clear());
+};
@@ -3,25 +3,35 @@
 // This file contains functions for RFP-related API calls.
 
 import api from './api';
+import { cachedGet, invalidateQueries } from './queryCache';
 
-export const getRFPs = () => {
-  return api.get('/rfps/');
+// Reads go through the query cache. `onUpdate` receives fresh data when the
+// cached data returned first turns out to be stale, until `signal` is aborted.
+// Mutations invalidate the cached URLs whose data they change.
+const RFP_LISTS = '/rfps/?';
+const MY_SUBMISSIONS = '/rfps/submissions/my';
+
+// The dashboards only show the start of each text, so lists use the summary view
+export const getRFPs = (onUpdate?: (data: any) => void, signal?: AbortSignal) => {
+  return cachedGet('/rfps/', { view: 'summary' }, onUpdate, signal);
 };
 
-export const getMySubmissions = () => {
-  return api.get('/rfps/submissions/my');
+export const getMySubmissions = (onUpdate?: (data: any) => void, signal?: AbortSignal) => {
+  return cachedGet(MY_SUBMISSIONS, { view: 'summary' }, onUpdate, signal);
 };
 
+// Searches are not cached: each one is typed by the user and should show
+// newly published RFPs straight away
 export const searchRFPs = (query: string) => {
-  return api.get('/rfps/search', { params: { q: query } });
+  return api.get('/rfps/search', { params: { q: query, view: 'summary' } });
 };
 
-export const getRFPById = (rfpId: string) => {
-  return api.get(`/rfps/${rfpId}`);
+export const getRFPById = (rfpId: string, onUpdate?: (data: any) => void, signal?: AbortSignal) => {
+  return cachedGet(`/rfps/${rfpId}`, undefined, onUpdate, signal);
 };
 
-export const getResponsesForRFP = (rfpId: string) => {
-  return api.get(`/rfps/${rfpId}/responses`);
+export const getResponsesForRFP = (rfpId: string, onUpdate?: (data: any) => void, signal?: AbortSignal) => {
+  return cachedGet(`/rfps/${rfpId}/responses`, undefined, onUpdate, signal);
 };
 
 export const createRFP = (title: string, description: string, file: File) => {
@@ -32,19 +42,32 @@ export const createRFP = (title: string, description: string, file: File) => {
 
   return api.post('/rfps/', formData, {
     headers: { 'Content-Type': 'multipart/form-data' },
+  }).then((response) => {
+    invalidateQueries(RFP_LISTS);
+    return response;
   });
 };
 
 export const updateRFPStatus = (rfpId: string, status: string) => {
-  return api.patch(`/rfps/${rfpId}/status`, { status });
+  return api.patch(`/rfps/${rfpId}/status`, { status }).then((response) => {
+    // Publishing also changes what suppliers see in their lists
+    invalidateQueries(`/rfps/${rfpId}`, RFP_LISTS);
+    return response;
+  });
 };
 
 export const updateResponseStatus = (rfpId: string, responseId: string, status: 'Approved' | 'Rejected') => {
-  return api.patch(`/rfps/${rfpId}/responses/${responseId}/status`, { status });
+  return api.patch(`/rfps/${rfpId}/responses/${responseId}/status`, { status }).then((response) => {
+    invalidateQueries(`/rfps/${rfpId}`, RFP_LISTS, MY_SUBMISSIONS);
+    return response;
+  });
 };
 
 export const deleteRFP = (rfpId: string) => {
-  return api.delete(`/rfps/${rfpId}`);
+  return api.delete(`/rfps/${rfpId}`).then((response) => {
+    invalidateQueries(`/rfps/${rfpId}`, RFP_LISTS);
+    return response;
+  });
 };
 
 export const submitResponse = (rfpId: string, responseText: string, file: File) => {
@@ -54,5 +77,9 @@ export const submitResponse = (rfpId: string, responseText: string, file: File)
 
   return api.post(`/rfps/${rfpId}/responses`, formData, {
     headers: { 'Content-Type': 'multipart/form-data' },
+  }).then((response) => {
+    // The RFP's status changes to 'Response Submitted'
+    invalidateQueries(`/rfps/${rfpId}`, RFP_LISTS, MY_SUBMISSIONS);
+    return response;
   });
 };
\ No newline at end of file